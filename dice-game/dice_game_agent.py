@@ -19,8 +19,10 @@ class DiceGameAgent(BaseAgent):
       * pass: Skip betting
     """
     
-    def __init__(self, agent_id: str = "dice_player", model: str = None):
-        super().__init__(agent_id, model=model)
+    def __init__(self, agent_id: str = "dice_player", model: str = None,
+                 reasoning_effort: str = "low", http_client=None):
+        super().__init__(agent_id, model=model, reasoning_effort=reasoning_effort,
+                         http_client=http_client)
         
         # Suppress noisy HTTP logs for cleaner game output
         logging.getLogger('httpx').setLevel(logging.WARNING)
@@ -182,7 +184,7 @@ class DiceGameAgent(BaseAgent):
         
         # Execute decision-making macro
         llm_start = time.time()
-        print(f"  🔄 Calling LLM for decision...")
+        print(f"  🔄 Calling LLM for decision...", flush=True)
         result = self.execute_macro(decision_prompt)
         llm_time = time.time() - llm_start
         
@@ -2,11 +2,14 @@
 """Dice Game Orchestrator - Execute strategic dice betting game with NLM agents"""
 
 import sys
+import asyncio
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
 
 from dice_game_agent import DiceGameAgent
-from multi_agent_system import MultiAgentSystem
 
 
 def parse_arguments():
@@ -31,7 +34,8 @@ def parse_arguments():
                        help='Number of agents to run in parallel (default: 1)')
     
     parser.add_argument('--verbose', '-v',
-                       action='store_true',
+                       action=argparse.BooleanOptionalAction,
+                       default=False,
                        help='Enable verbose output')
     
     return parser.parse_args()
@@ -54,20 +58,25 @@ def setup_logging(verbose=False):
     
     # Keep our game logs visible
     logging.getLogger('dice_game_agent').setLevel(level)
-    logging.getLogger('multi_agent_system').setLevel(level)
+    logging.getLogger('dice_tournament').setLevel(level)
+
+
+def create_http_client():
+    """Create one keep-alive connection pool shared by all agents"""
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=64)
+    )
 
 
-def create_dice_agents(num_agents, model, reasoning):
+def create_dice_agents(num_agents, model, reasoning, http_client=None):
     """Create dice game agents with specified configuration"""
     agents = []
     
     for i in range(num_agents):
         agent_id = f"dice_player_{i+1}" if num_agents > 1 else "dice_player"
-        agent = DiceGameAgent(agent_id, model=model)
-        
-        # Configure reasoning
-        agent.session.set_reasoning_effort(reasoning)
-        
+        # reasoning was validated once by argparse choices; pass it straight through
+        agent = DiceGameAgent(agent_id, model=model, reasoning_effort=reasoning,
+                              http_client=http_client)
         agents.append(agent)
         
     return agents
@@ -80,36 +89,53 @@ def run_game(agents):
         agent = agents[0]
         print(f"🎲 Starting Dice Game with {agent.agent_id}")
         print("="*50)
+        sys.stdout.flush()
         
         result = agent.run()
         
         print("="*50)
         print(f"🏁 Final Result: {result['final_assets']} chips")
         print(f"Victory: {'✅ Yes' if result['target_reached'] else '❌ No'}")
+        sys.stdout.flush()
         
     else:
-        # Multiple agents - use MultiAgentSystem for parallel execution
+        # Multiple agents - run concurrently and report each game as it finishes
         print(f"🎲 Starting {len(agents)} Parallel Games")
         print("="*50)
         
-        system = MultiAgentSystem("dice_tournament")
-        for agent in agents:
-            system.add_agent(agent)
-        
         print("🚀 Running games in parallel...")
-        results = system.run_parallel()
+        sys.stdout.flush()
+        asyncio.run(run_tournament(agents))
+
+
+async def run_tournament(agents):
+    """Run agents concurrently, printing each result as soon as its game ends"""
+    loop = asyncio.get_running_loop()
+    logger = logging.getLogger('dice_tournament')
+    
+    with ThreadPoolExecutor(max_workers=len(agents)) as executor:
+        async def play(agent):
+            """Run one agent's game in the pool and return its outcome"""
+            try:
+                result = await loop.run_in_executor(executor, agent.run)
+                final_assets = result['final_assets']
+            except Exception as e:
+                logger.error(f"Agent {agent.agent_id} failed: {e}")
+                final_assets = int(agent.session.get("assets") or 0)
+            return agent.agent_id, final_assets, final_assets >= 30
         
         print("="*50)
         print("📊 Tournament Results:")
         victories = 0
-        for agent in agents:
-            final_assets = int(agent.session.get("assets") or 0)
-            target_reached = final_assets >= 30
+        for coro in asyncio.as_completed([play(agent) for agent in agents]):
+            agent_id, final_assets, target_reached = await coro
             if target_reached:
                 victories += 1
-            print(f"🎯 {agent.agent_id}: {final_assets} chips {'✅' if target_reached else '❌'}")
-        
-        print(f"\nTournament Summary: {victories}/{len(agents)} victories ({victories/len(agents)*100:.1f}%)")
+            print(f"🎯 {agent_id}: {final_assets} chips {'✅' if target_reached else '❌'}")
+            sys.stdout.flush()
+    
+    print(f"\nTournament Summary: {victories}/{len(agents)} victories ({victories/len(agents)*100:.1f}%)")
+    sys.stdout.flush()
 
 
 def main():
@@ -117,6 +143,8 @@ def main():
     args = parse_arguments()
     
     # Setup
+    # Block-buffer stdout; each section flushes explicitly when it completes
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     setup_logging(args.verbose)
     
     print("🎲 Dice Game Orchestrator")
@@ -124,18 +152,22 @@ def main():
     print(f"Model: {args.model} | Reasoning: {args.reasoning}")
     print()
     
-    # Create agents
-    agents = create_dice_agents(args.agents, args.model, args.reasoning)
+    # Create agents sharing one HTTP connection pool
+    http_client = create_http_client()
     
     try:
+        agents = create_dice_agents(args.agents, args.model, args.reasoning, http_client)
         run_game(agents)
     except KeyboardInterrupt:
         print("\n\n⚠️ Game interrupted by user")
     except Exception as e:
         print(f"\n❌ Error during game execution: {e}")
         sys.exit(1)
+    finally:
+        http_client.close()
     
     print("\n🎯 Thank you for playing!")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -30,6 +30,7 @@ def demo_cli_functionality():
         print("─" * 50)
         cmd_func()
         print()
+        sys.stdout.flush()
         time.sleep(1.5)
     
     # Demo 1: Show initial status
@@ -61,8 +62,7 @@ def demo_cli_functionality():
     # Demo 4: Adjust flows
     def cmd_adjust_flows():
         print("🔧 Adjusting path flows:")
-        success1, msg1 = controller.update_path_flow("P1", -2.0)
-        success2, msg2 = controller.update_path_flow("P2", +1.5)
+        (success1, msg1, _), (success2, msg2, _) = controller.apply_adjustments([("P1", -2.0), ("P2", +1.5)])
         print(f"  adjust P1 -2.0  → {'✅' if success1 else '❌'} {msg1}")
         print(f"  adjust P2 +1.5  → {'✅' if success2 else '❌'} {msg2}")
         network.generate_alerts()
@@ -77,6 +77,7 @@ def demo_cli_functionality():
             network.advance_timestep()
             print(f"  t={network.timestep}: ", end="")
             display.display_compact_status(network)
+            sys.stdout.flush()
             time.sleep(0.5)
     
     execute_command("step 5", cmd_advance_time)
@@ -84,7 +85,8 @@ def demo_cli_functionality():
     # Demo 6: Force edge failure
     def cmd_force_failure():
         print("⚠️  Forcing edge failure to demonstrate auto-handling:")
-        print(f"  Before failure: P1={network.paths['P1'].current_flow:.1f}, P2={network.paths['P2'].current_flow:.1f}")
+        p1_flow, p2_flow = network.path_flows[:2]
+        print(f"  Before failure: P1={p1_flow:.1f}, P2={p2_flow:.1f}")
         
         # Force edge failure
         network.edges["e1"].is_failed = True
@@ -94,7 +96,8 @@ def demo_cli_functionality():
         # Handle failures
         num_affected, affected_paths = controller.handle_failed_edges()
         print(f"  → Auto-handled {num_affected} paths: {affected_paths}")
-        print(f"  After handling: P1={network.paths['P1'].current_flow:.1f}, P2={network.paths['P2'].current_flow:.1f}")
+        p1_flow, p2_flow = network.path_flows[:2]
+        print(f"  After handling: P1={p1_flow:.1f}, P2={p2_flow:.1f}")
     
     execute_command("force failure + auto-handle", cmd_force_failure)
     
@@ -139,7 +142,10 @@ def demo_cli_functionality():
     print("✅ Automatic edge failure handling")
     print("✅ System validation and health checks")
     print("\n🚀 To try interactive mode: uv run python interactive_monitor.py")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout; sections flush explicitly at their breakpoints
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     demo_cli_functionality()
\ No newline at end of file
@@ -5,6 +5,7 @@ CUI Demo - Command Line Interface Demonstration
 Shows various CUI capabilities for the flow control system.
 """
 
+import sys
 import time
 from network_model import create_simple_network
 from flow_operations import FlowController, FlowOptimizer
@@ -51,6 +52,7 @@ def demo_cui_features():
     for i in range(8):
         network.advance_timestep()
         display.display_compact_status(network)
+        sys.stdout.flush()
         time.sleep(0.8)
     
     input("\nPress Enter for next demo...")
@@ -81,12 +83,14 @@ def demo_cui_features():
         ("P2", -1.0, "Fine-tune P2")
     ]
     
-    for path, delta, description in adjustments:
+    results = controller.apply_adjustments([(path, delta) for path, delta, _ in adjustments])
+    network.generate_alerts()
+    
+    for (_, _, description), (success, msg, flows) in zip(adjustments, results):
         print(f"\n📝 Action: {description}")
-        success, msg = controller.update_path_flow(path, delta)
-        network.generate_alerts()
         print(f"   {msg}")
-        display.display_compact_status(network)
+        print("   Flows: " + ", ".join(f"{pid}={flow:.1f}" for pid, flow in zip(network.path_ids, flows)))
+        sys.stdout.flush()
         time.sleep(1.0)
     
     print(f"\n🏁 Final optimized state:")
@@ -96,6 +100,7 @@ def demo_cui_features():
     print("🎉 CUI Demonstration Complete!")
     print("💡 Try 'uv run python interactive_monitor.py' for interactive control")
     print("=" * 80)
+    sys.stdout.flush()
 
 
 def quick_status_check():
@@ -115,10 +120,12 @@ def quick_status_check():
     
     network.generate_alerts()
     display.display_network_status(network)
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
-    import sys
+    # Block-buffer stdout; input() and explicit flushes mark section breaks
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     
     if len(sys.argv) > 1 and sys.argv[1] == "--quick":
         quick_status_check()
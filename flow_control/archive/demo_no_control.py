@@ -55,7 +55,8 @@ def demo_no_flow_control():
             visualizer.update_visualization(network)
             visualizer.save_snapshot(f"demo_no_control_t{timestep:02d}.png")
     
-    print(f"\nFinal flows: P1={network.paths['P1'].current_flow:.2f}, P2={network.paths['P2'].current_flow:.2f}")
+    p1_flow, p2_flow = network.path_flows[:2]
+    print(f"\nFinal flows: P1={p1_flow:.2f}, P2={p2_flow:.2f}")
     print(f"Final throughput: {network.calculate_total_throughput():.2f}")
     
     print("\n📸 Generated files:")
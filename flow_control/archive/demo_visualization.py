@@ -10,12 +10,21 @@ import matplotlib
 # Use non-interactive backend for demo screenshots
 matplotlib.use('Agg')
 
+import glob
+import os
+import sys
 import matplotlib.pyplot as plt
+import networkx as nx
+import numpy as np
 import time
 import random
 from network_model import create_simple_network
 from flow_operations import FlowController, FlowOptimizer
-from network_visualizer import NetworkVisualizer
+from network_visualizer import NetworkVisualizer, VisualizationConfig, flush_snapshot_writes
+
+
+# Screen-resolution output is plenty for demo images; HIGH_RES_DEMO=1 restores 300 dpi
+DEMO_DPI = 300 if os.environ.get('HIGH_RES_DEMO') == '1' else int(os.environ.get('DEMO_DPI', '120'))
 
 
 def demo_basic_visualization():
@@ -26,7 +35,7 @@ def demo_basic_visualization():
     # Create and set up network
     network = create_simple_network()
     controller = FlowController(network)
-    visualizer = NetworkVisualizer()
+    visualizer = NetworkVisualizer(VisualizationConfig(snapshot_dpi=DEMO_DPI))
     
     print("📊 Setting up network with initial flows...")
     
@@ -40,18 +49,21 @@ def demo_basic_visualization():
     visualizer.save_snapshot("demo_step_00_initial.png")
     
     print(f"Initial state: Throughput={network.calculate_total_throughput():.1f}")
-    print(f"P1 flow: {network.paths['P1'].current_flow:.1f}")
-    print(f"P2 flow: {network.paths['P2'].current_flow:.1f}")
+    p1_flow, p2_flow = network.path_flows[:2]
+    print(f"P1 flow: {p1_flow:.1f}")
+    print(f"P2 flow: {p2_flow:.1f}")
     print("📸 Saved: demo_step_00_initial.png")
+    sys.stdout.flush()
     
     return network, controller, visualizer
 
 
-def demo_overload_scenario():
+def demo_overload_scenario(network=None, controller=None, visualizer=None):
     """Demonstrate overload detection and visualization"""
     print("\n🔥 Demonstrating Overload Scenario...")
     
-    network, controller, visualizer = demo_basic_visualization()
+    if visualizer is None:
+        network, controller, visualizer = demo_basic_visualization()
     
     # Create overload situation
     print("Creating overload on P1...")
@@ -71,15 +83,17 @@ def demo_overload_scenario():
     # Show validation results
     validation = controller.validate_and_report()
     print(f"Validation: {len(validation['capacity_overloads'])} overloads detected")
+    sys.stdout.flush()
     
     return network, controller, visualizer
 
 
-def demo_failure_recovery():
+def demo_failure_recovery(network=None, controller=None, visualizer=None):
     """Demonstrate failure and recovery scenarios"""
     print("\n⚡ Demonstrating Failure and Recovery...")
     
-    network, controller, visualizer = demo_overload_scenario()
+    if visualizer is None:
+        network, controller, visualizer = demo_overload_scenario()
     
     # Force edge failure
     print("Forcing edge e2 failure...")
@@ -109,15 +123,17 @@ def demo_failure_recovery():
     visualizer.save_snapshot("demo_step_03_recovery.png")
     print("📸 Saved: demo_step_03_recovery.png")
     print(f"After recovery: {len(alerts)} alerts")
+    sys.stdout.flush()
     
     return network, controller, visualizer
 
 
-def demo_optimization():
+def demo_optimization(network=None, controller=None, visualizer=None):
     """Demonstrate optimization algorithms"""
     print("\n🎯 Demonstrating Optimization Algorithms...")
     
-    network, controller, visualizer = demo_failure_recovery()
+    if visualizer is None:
+        network, controller, visualizer = demo_failure_recovery()
     
     # Clear flows and optimize
     print("Clearing flows and running greedy optimization...")
@@ -133,25 +149,32 @@ def demo_optimization():
     visualizer.update_visualization(network)
     visualizer.save_snapshot("demo_step_04_optimized.png")
     print("📸 Saved: demo_step_04_optimized.png")
+    sys.stdout.flush()
     
     return network, controller, visualizer
 
 
-def demo_time_progression():
+def demo_time_progression(network=None, controller=None, visualizer=None):
     """Demonstrate time progression with capacity changes"""
     print("\n⏰ Demonstrating Time Progression...")
     
-    network, controller, visualizer = demo_optimization()
+    if visualizer is None:
+        network, controller, visualizer = demo_optimization()
     
     print("Simulating 10 timesteps with random capacity changes...")
     
+    # Draw all random flow adjustments up front from one seeded generator
+    rng = np.random.default_rng(42)
+    path_choices = rng.choice(["P1", "P2"], size=10)
+    deltas = rng.uniform(-0.5, 0.5, size=10)
+    
     for timestep in range(1, 11):
         network.advance_timestep()
         
         # Occasionally adjust flows randomly
         if timestep % 3 == 0:
-            path_id = random.choice(["P1", "P2"])
-            delta = random.uniform(-0.5, 0.5)
+            path_id = str(path_choices[timestep - 1])
+            delta = float(deltas[timestep - 1])
             success, msg = controller.update_path_flow(path_id, delta)
             if success:
                 print(f"  t={timestep}: Adjusted {path_id} by {delta:.2f}")
@@ -167,15 +190,17 @@ def demo_time_progression():
             visualizer.update_visualization(network)
             visualizer.save_snapshot(f"demo_step_05_t{timestep:02d}.png")
             print(f"    📸 Saved: demo_step_05_t{timestep:02d}.png")
+    sys.stdout.flush()
     
     return network, controller, visualizer
 
 
-def demo_performance_analysis():
+def demo_performance_analysis(network=None, controller=None, visualizer=None):
     """Demonstrate performance analysis visualization"""
     print("\n📈 Performance Analysis Summary...")
     
-    network, controller, visualizer = demo_time_progression()
+    if visualizer is None:
+        network, controller, visualizer = demo_time_progression()
     
     # Final state analysis
     print(f"Final network state (t={network.timestep}):")
@@ -197,6 +222,7 @@ def demo_performance_analysis():
     visualizer.update_visualization(network)
     visualizer.save_snapshot("demo_step_06_final.png")
     print("📸 Saved: demo_step_06_final.png")
+    sys.stdout.flush()
     
     return network, controller, visualizer
 
@@ -233,84 +259,76 @@ def create_comparison_visualization():
     net3.generate_alerts()
     states.append(("Edge e1 Failed", net3))
     
+    # All states share one topology: build the graph and layout once
+    visualizer = NetworkVisualizer()
+    visualizer._build_networkx_graph(states[0][1])
+    graph, pos = visualizer.graph, visualizer.pos
+    graph_edge_pairs = [(u, v) for u, v, _ in graph.edges(data='edge_id')]
+    graph_edge_ids = [edge_id for _, _, edge_id in graph.edges(data='edge_id')]
+    
+    # Node colors depend only on node type
+    node_colors = []
+    for node_id in graph.nodes():
+        node = states[0][1].nodes.get(node_id)
+        if node and node.type == 'source':
+            node_colors.append('#2E8B57')
+        elif node and node.type == 'sink':
+            node_colors.append('#DC143C')
+        else:
+            node_colors.append('#4682B4')
+    
     # Create comparison visualization
-    fig, axes = plt.subplots(1, 3, figsize=(20, 6))
+    fig, axes = plt.subplots(1, 3, figsize=(20, 6), subplot_kw={'aspect': 'equal'})
     fig.suptitle('Network State Comparison', fontsize=16, fontweight='bold')
     
     for i, (title, network) in enumerate(states):
-        visualizer = NetworkVisualizer()
-        # Set up single subplot
-        temp_fig, temp_axes = plt.subplots(2, 2, figsize=(10, 8))
-        visualizer.axes = temp_axes
-        visualizer.fig = temp_fig
-        visualizer._build_networkx_graph(network)
-        
         # Draw only topology on comparison plot
         ax = axes[i]
         ax.set_title(f'{title}\nThroughput: {network.calculate_total_throughput():.1f}, Alerts: {len(network.alerts)}')
         
-        # Simple network drawing for comparison
-        if visualizer.graph and visualizer.pos:
-            import networkx as nx
-            
-            # Node colors
-            node_colors = []
-            for node_id in visualizer.graph.nodes():
-                node = network.nodes.get(node_id)
-                if node:
-                    if node.type == 'source':
-                        node_colors.append('#2E8B57')
-                    elif node.type == 'sink':
-                        node_colors.append('#DC143C')
-                    else:
-                        node_colors.append('#4682B4')
-                else:
-                    node_colors.append('#4682B4')
-            
-            # Draw nodes
-            nx.draw_networkx_nodes(visualizer.graph, visualizer.pos, ax=ax,
-                                  node_color=node_colors, node_size=600, alpha=0.8)
-            
-            # Edge colors based on state
-            normal_edges = []
-            overload_edges = []
-            failed_edges = []
-            
-            for (u, v, data) in visualizer.graph.edges(data=True):
-                edge_obj = data.get('edge_obj')
-                if edge_obj:
-                    if edge_obj.is_failed or edge_obj.capacity == 0:
-                        failed_edges.append((u, v))
-                    elif edge_obj.overload_alert or edge_obj.flow > edge_obj.capacity:
-                        overload_edges.append((u, v))
-                    else:
-                        normal_edges.append((u, v))
-            
-            # Draw edges
-            if normal_edges:
-                nx.draw_networkx_edges(visualizer.graph, visualizer.pos, ax=ax,
-                                      edgelist=normal_edges, edge_color='#708090', width=2)
-            if overload_edges:
-                nx.draw_networkx_edges(visualizer.graph, visualizer.pos, ax=ax,
-                                      edgelist=overload_edges, edge_color='#FF4500', width=3)
-            if failed_edges:
-                nx.draw_networkx_edges(visualizer.graph, visualizer.pos, ax=ax,
-                                      edgelist=failed_edges, edge_color='#8B0000', 
-                                      width=3, style='dashed')
-            
-            # Labels
-            nx.draw_networkx_labels(visualizer.graph, visualizer.pos, ax=ax, 
-                                   font_size=10, font_weight='bold')
+        # Draw nodes
+        nx.draw_networkx_nodes(graph, pos, ax=ax,
+                              node_color=node_colors, node_size=600, alpha=0.8)
         
-        ax.set_aspect('equal')
-        ax.axis('off')
+        # Classify edges by state with boolean masks over this state's edges
+        edge_objs = [network.edges[edge_id] for edge_id in graph_edge_ids]
+        flows = np.array([e.flow for e in edge_objs])
+        caps = np.array([e.capacity for e in edge_objs])
+        failed = np.array([e.is_failed for e in edge_objs], dtype=bool)
+        alert = np.array([e.overload_alert for e in edge_objs], dtype=bool)
+        
+        fail_mask = failed | (caps == 0)
+        over_mask = ~fail_mask & (alert | (flows > caps))
+        norm_mask = ~(fail_mask | over_mask)
+        
+        normal_edges = [graph_edge_pairs[j] for j in np.flatnonzero(norm_mask)]
+        overload_edges = [graph_edge_pairs[j] for j in np.flatnonzero(over_mask)]
+        failed_edges = [graph_edge_pairs[j] for j in np.flatnonzero(fail_mask)]
+        
+        # Draw edges
+        if normal_edges:
+            nx.draw_networkx_edges(graph, pos, ax=ax,
+                                  edgelist=normal_edges, edge_color='#708090', width=2)
+        if overload_edges:
+            nx.draw_networkx_edges(graph, pos, ax=ax,
+                                  edgelist=overload_edges, edge_color='#FF4500', width=3)
+        if failed_edges:
+            nx.draw_networkx_edges(graph, pos, ax=ax,
+                                  edgelist=failed_edges, edge_color='#8B0000', 
+                                  width=3, style='dashed')
         
-        plt.close(temp_fig)  # Clean up temporary figure
+        # Labels
+        nx.draw_networkx_labels(graph, pos, ax=ax, 
+                               font_size=10, font_weight='bold')
+        
+        ax.axis('off')
     
-    plt.tight_layout()
-    plt.savefig("demo_comparison.png", dpi=300, bbox_inches='tight')
+    # Fixed 1x3 grid: set the margins directly instead of running tight_layout
+    fig.subplots_adjust(left=0.02, right=0.98, top=0.85, bottom=0.05, wspace=0.05)
+    plt.savefig("demo_comparison.png", dpi=DEMO_DPI, bbox_inches='tight')
     plt.close(fig)
     print("📸 Saved: demo_comparison.png")
+    sys.stdout.flush()
 
 
 def main():
@@ -319,25 +337,28 @@ def main():
     print("=" * 60)
     
     try:
-        # Set random seed for reproducible demo
+        # Seed the global RNG used by network capacity updates for a reproducible demo
         random.seed(42)
         
-        # Run demonstration sequence
-        network, controller, visualizer = demo_basic_visualization()
-        demo_overload_scenario()
-        demo_failure_recovery()
-        demo_optimization()
-        demo_time_progression()
-        demo_performance_analysis()
+        # Run demonstration sequence, threading one network and visualizer
+        # (and its figure) through every step
+        state = demo_basic_visualization()
+        state = demo_overload_scenario(*state)
+        state = demo_failure_recovery(*state)
+        state = demo_optimization(*state)
+        state = demo_time_progression(*state)
+        demo_performance_analysis(*state)
         create_comparison_visualization()
         
+        # Wait for background snapshot writes before listing the files
+        flush_snapshot_writes()
+        
         print("\n" + "=" * 60)
         print("✅ Visualization Demo Complete!")
         print("=" * 60)
         
         print("Generated visualization files:")
-        import os
-        demo_files = [f for f in os.listdir('.') if f.startswith('demo_')]
+        demo_files = glob.glob('demo_*')
         for file in sorted(demo_files):
             print(f"  📸 {file}")
         
@@ -348,6 +369,7 @@ def main():
         print("  • Performance history tracking")
         print("  • Alert dashboard with system status")
         print("  • Multi-state comparison capabilities")
+        sys.stdout.flush()
         
     except Exception as e:
         print(f"❌ Demo failed: {e}")
@@ -355,4 +377,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout; each demo step flushes its output when it completes
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     main()
\ No newline at end of file
@@ -6,7 +6,12 @@ Demonstrates flow control with overlapping paths where multiple paths
 share common edges, requiring careful flow aggregation and management.
 """
 
+from collections import defaultdict
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
+
+import numpy as np
+
 from network_model import NetworkState, NetworkNode, NetworkEdge, NetworkPath
 from flow_operations import FlowController
 from network_display import NetworkCUIDisplay
@@ -76,6 +81,14 @@ def create_shared_path_network() -> NetworkState:
     return network
 
 
+@dataclass(frozen=True, slots=True)
+class EdgeAlert:
+    """Capacity alert for a single edge"""
+    edge_id: str
+    alert_type: str  # 'failure' or 'overload'
+    description: str
+
+
 class SharedPathFlowManager:
     """Manager for handling flows on overlapping paths"""
     
@@ -87,18 +100,32 @@ class SharedPathFlowManager:
         
         # Build edge-to-paths mapping
         self.edge_to_paths = self._build_edge_path_mapping()
+        
+        # Static edge x path incidence matrix, columns aligned with network.path_flows
+        self._edge_ids = list(self.network.edges)
+        self._edge_index = {eid: i for i, eid in enumerate(self._edge_ids)}
+        path_columns = {pid: j for j, pid in enumerate(self.network.path_ids)}
+        self._incidence = np.zeros((len(self._edge_ids), len(self.network.path_ids)))
+        for path_id, path in self.network.paths.items():
+            for edge_id in path.edges:
+                if edge_id in self._edge_index:
+                    self._incidence[self._edge_index[edge_id], path_columns[path_id]] = 1.0
+        
+        # Only edges carried by more than one path can violate sharing constraints
+        self._shared_edge_ids = tuple(eid for eid in self._edge_ids
+                                      if len(self.edge_to_paths.get(eid, ())) > 1)
+        self._shared_edge_idx = np.array([self._edge_index[eid] for eid in self._shared_edge_ids],
+                                         dtype=int)
     
     def _build_edge_path_mapping(self) -> Dict[str, List[str]]:
         """Build mapping of which paths use each edge"""
-        edge_to_paths = {}
+        edge_to_paths = defaultdict(list)
         
         for path_id, path in self.network.paths.items():
             for edge_id in path.edges:
-                if edge_id not in edge_to_paths:
-                    edge_to_paths[edge_id] = []
                 edge_to_paths[edge_id].append(path_id)
         
-        return edge_to_paths
+        return dict(edge_to_paths)
     
     def calculate_edge_flows(self) -> Dict[str, float]:
         """
@@ -106,18 +133,8 @@ class SharedPathFlowManager:
         
         For shared edges, the flow is the sum of all paths using that edge.
         """
-        edge_flows = {}
-        
-        for edge_id in self.network.edges:
-            edge_flows[edge_id] = 0.0
-            
-            # Sum flows from all paths using this edge
-            if edge_id in self.edge_to_paths:
-                for path_id in self.edge_to_paths[edge_id]:
-                    path = self.network.paths[path_id]
-                    edge_flows[edge_id] += path.current_flow
-        
-        return edge_flows
+        totals = self._incidence @ self.network.path_flows
+        return dict(zip(self._edge_ids, totals.tolist()))
     
     def update_edge_flows_from_paths(self):
         """Update all edge flows based on current path flows"""
@@ -126,6 +143,28 @@ class SharedPathFlowManager:
         for edge_id, flow in edge_flows.items():
             self.network.edges[edge_id].flow = flow
     
+    def update_and_alert(self) -> List[EdgeAlert]:
+        """
+        Update edge flows from path flows and collect capacity alerts in one pass.
+        
+        Returns:
+            List of EdgeAlert for failed and overloaded edges
+        """
+        totals = self._incidence @ self.network.path_flows
+        alerts = []
+        
+        for edge_id, flow, edge in zip(self._edge_ids, totals.tolist(), self.network.edges.values()):
+            edge.flow = flow
+            if edge.is_failed or edge.capacity == 0:
+                if flow > 0:
+                    alerts.append(EdgeAlert(edge_id, 'failure',
+                                            f"Edge {edge_id} failed with flow {flow:.1f}"))
+            elif flow > edge.capacity:
+                alerts.append(EdgeAlert(edge_id, 'overload',
+                                        f"Edge {edge_id} overloaded: {flow:.1f} > {edge.capacity:.1f}"))
+        
+        return alerts
+    
     def display_shared_edge_analysis(self):
         """Display analysis of shared edges"""
         print("\n📊 Shared Edge Analysis")
@@ -139,15 +178,19 @@ class SharedPathFlowManager:
             print("No shared edges in this network.")
             return
         
+        # Snapshot path flows, sort once and total each edge once for both sections
+        flows = dict(zip(self.network.path_ids, self.network.path_flows.tolist()))
+        items = sorted(shared_edges.items())
+        totals = {edge_id: sum(flows[pid] for pid in path_list)
+                  for edge_id, path_list in items}
+        
         print(f"{'Edge':<6} {'Capacity':<10} {'Total Flow':<12} {'Paths Using Edge':<30} {'Status'}")
         print("-" * 70)
         
-        for edge_id, path_list in sorted(shared_edges.items()):
+        for edge_id, path_list in items:
             edge = self.network.edges[edge_id]
             path_str = ", ".join(path_list)
-            
-            # Calculate total flow from paths
-            total_flow = sum(self.network.paths[pid].current_flow for pid in path_list)
+            total_flow = totals[edge_id]
             
             # Status
             if total_flow > edge.capacity:
@@ -161,13 +204,11 @@ class SharedPathFlowManager:
         
         # Show flow breakdown
         print("\n📈 Flow Breakdown by Path:")
-        for edge_id, path_list in sorted(shared_edges.items()):
+        for edge_id, path_list in items:
             print(f"\n{edge_id} (capacity={self.network.edges[edge_id].capacity:.1f}):")
             for path_id in path_list:
-                flow = self.network.paths[path_id].current_flow
-                print(f"  └─ {path_id}: {flow:.1f}")
-            total = sum(self.network.paths[pid].current_flow for pid in path_list)
-            print(f"  Total: {total:.1f}")
+                print(f"  └─ {path_id}: {flows[path_id]:.1f}")
+            print(f"  Total: {totals[edge_id]:.1f}")
     
     def check_shared_edge_constraints(self) -> List[Tuple[str, float, float]]:
         """
@@ -176,16 +217,12 @@ class SharedPathFlowManager:
         Returns:
             List of (edge_id, total_flow, capacity) for violated edges
         """
-        violations = []
-        
-        edge_flows = self.calculate_edge_flows()
+        totals = (self._incidence @ self.network.path_flows)[self._shared_edge_idx]
+        caps = np.fromiter((self.network.edges[eid].capacity for eid in self._shared_edge_ids),
+                           dtype=float, count=len(self._shared_edge_ids))
         
-        for edge_id, total_flow in edge_flows.items():
-            edge = self.network.edges[edge_id]
-            if total_flow > edge.capacity:
-                violations.append((edge_id, total_flow, edge.capacity))
-        
-        return violations
+        return [(self._shared_edge_ids[i], float(totals[i]), float(caps[i]))
+                for i in np.where(totals > caps)[0]]
     
     def optimize_with_sharing(self) -> Tuple[bool, str]:
         """
@@ -199,21 +236,24 @@ class SharedPathFlowManager:
         if not violations:
             return True, "No shared edge violations found"
         
-        adjustments = []
+        # Accumulate each path's share of every overload, then assign once per path
+        reduction = np.zeros(len(self.network.path_ids))
         
         for edge_id, total_flow, capacity in violations:
-            overload = total_flow - capacity
-            paths_using = self.edge_to_paths.get(edge_id, [])
+            row = self._incidence[self._edge_index[edge_id]]
+            paths_using = np.count_nonzero(row)
             
-            if len(paths_using) > 1:
+            if paths_using > 1:
                 # Distribute reduction among paths using this edge
-                reduction_per_path = overload / len(paths_using)
-                
-                for path_id in paths_using:
-                    current_flow = self.network.paths[path_id].current_flow
-                    new_flow = max(0, current_flow - reduction_per_path)
-                    self.controller.set_path_flow(path_id, new_flow)
-                    adjustments.append(f"{path_id}→{new_flow:.1f}")
+                reduction += row * ((total_flow - capacity) / paths_using)
+        
+        new_flows = np.maximum(0, self.network.path_flows - reduction)
+        adjustments = []
+        
+        for j in np.flatnonzero(reduction):
+            path_id = self.network.path_ids[j]
+            self.controller.set_path_flow(path_id, float(new_flows[j]))
+            adjustments.append(f"{path_id}→{new_flows[j]:.1f}")
         
         return True, f"Adjusted flows: {', '.join(adjustments)}"
 
@@ -244,8 +284,7 @@ def demonstrate_shared_paths():
     manager.controller.set_path_flow('P4', 2.0)
     
     # Update edge flows based on path flows
-    manager.update_edge_flows_from_paths()
-    network.generate_alerts()
+    manager.update_and_alert()
     
     print("  P1: 5.0, P2: 4.0, P3: 3.0, P4: 2.0")
     
@@ -272,8 +311,7 @@ def demonstrate_shared_paths():
     print(f"  {msg}")
     
     # Update and show results
-    manager.update_edge_flows_from_paths()
-    network.generate_alerts()
+    manager.update_and_alert()
     
     print("\n📊 After Optimization:")
     manager.display_shared_edge_analysis()
@@ -9,6 +9,8 @@ from network_model import NetworkState, create_simple_network
 from shared_path_network import create_shared_path_network
 from flow_operations import FlowController
 from network_display import NetworkCUIDisplay
+import os
+import sys
 import time
 
 
@@ -144,7 +146,8 @@ def test_automatic_timestep_handling():
         print(f"   t={network.timestep}: P1={p1_flow:.1f}, P2={p2_flow:.1f}, Throughput={throughput:.1f}")
         print(f"         Edge status: e1={e1_status}, e3={e3_status}")
         
-        time.sleep(0.5)  # Brief pause for readability
+        if os.environ.get("DEMO_PACING"):
+            time.sleep(0.5)  # Brief pause for readability when watched live
 
 
 def test_manual_vs_automatic():
@@ -197,10 +200,12 @@ def main():
     print("=" * 80)
     
     # Run tests
-    test_simple_network_failure()
-    test_shared_network_failure()
-    test_automatic_timestep_handling()
-    test_manual_vs_automatic()
+    for test in (test_simple_network_failure,
+                 test_shared_network_failure,
+                 test_automatic_timestep_handling,
+                 test_manual_vs_automatic):
+        test()
+        sys.stdout.flush()
     
     print("\n" + "=" * 80)
     print("✅ All tests completed!")
@@ -210,7 +215,10 @@ def main():
     print("2. Shared edges affect multiple paths when they fail")
     print("3. Automatic handling works during timestep advancement")
     print("4. Manual and automatic handling produce identical results")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout; each test flushes its output when it completes
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     main()
\ No newline at end of file
@@ -6,6 +6,10 @@ Comprehensive demonstration that the flow control system works with
 arbitrary s-t network topologies, proving its generality and practical applicability.
 """
 
+import sys
+
+import numpy as np
+
 from network_generators import NetworkGenerator
 from flow_operations import FlowController
 from network_display import NetworkCUIDisplay
@@ -101,34 +105,28 @@ def test_network_functionality(network, name):
     # Basic info
     print(f"   Topology: {len(network.nodes)} nodes, {len(network.edges)} edges, {len(network.paths)} paths")
     
-    # Test 1: Max flow calculation
-    try:
-        calc = MaxFlowCalculator(network)
-        max_flow, _ = calc.calculate_max_flow()
-        print(f"   Max flow: {max_flow:.2f}")
-    except Exception as e:
-        print(f"   Max flow: ERROR - {str(e)[:30]}")
-        max_flow = 0
+    # Test 1: Max flow calculation (no s-t route with capacity means a zero max flow)
+    if network.is_solvable():
+        max_flow, _ = MaxFlowCalculator(network).calculate_max_flow()
+    else:
+        max_flow = 0.0
+    print(f"   Max flow: {max_flow:.2f}")
+    
+    # Max safe flow of every path is its bottleneck; capacities stay fixed until Test 6
+    max_safe_flows = controller.path_bottlenecks()
     
     # Test 2: Path analysis
     if network.paths:
-        path_id = list(network.paths.keys())[0]
-        alternatives = controller.calculate_max_safe_flow(path_id)
-        if not alternatives.get('error'):
-            print(f"   First path ({path_id}): max safe flow = {alternatives['max_safe_flow']:.2f}")
-        else:
-            print(f"   First path ({path_id}): ERROR")
+        print(f"   First path ({network.path_ids[0]}): max safe flow = {max_safe_flows[0]:.2f}")
     
     # Test 3: Flow control
     flow_test_results = []
-    for i, path_id in enumerate(list(network.paths.keys())[:3]):  # Test first 3 paths
-        alternatives = controller.calculate_max_safe_flow(path_id)
-        if not alternatives.get('error') and not alternatives.get('is_blocked'):
-            max_safe = alternatives['max_safe_flow']
-            if max_safe > 0:
-                test_flow = max_safe * 0.7  # Use 70% of max safe
-                success, _, _ = controller.set_path_flow_with_alternatives(path_id, test_flow)
-                flow_test_results.append(success)
+    for i, path_id in enumerate(network.path_ids[:3]):  # Test first 3 paths
+        max_safe = max_safe_flows[i]
+        if max_safe > 0:  # Not blocked
+            test_flow = max_safe * 0.7  # Use 70% of max safe
+            success, _, _ = controller.set_path_flow_with_alternatives(path_id, test_flow)
+            flow_test_results.append(success)
     
     success_rate = sum(flow_test_results) / len(flow_test_results) if flow_test_results else 0
     print(f"   Flow control: {success_rate:.1%} success rate ({len(flow_test_results)} tests)")
@@ -143,16 +141,15 @@ def test_network_functionality(network, name):
     # Test 5: Constraint enforcement
     constraint_tests = 0
     constraint_successes = 0
-    for path_id in list(network.paths.keys())[:2]:
-        alternatives = controller.calculate_max_safe_flow(path_id)
-        if not alternatives.get('error') and not alternatives.get('is_blocked'):
-            max_safe = alternatives['max_safe_flow']
-            if max_safe > 0:
-                # Try to set excessive flow (should fail)
-                success, _, _ = controller.set_path_flow_with_alternatives(path_id, max_safe * 2.0)
-                constraint_tests += 1
-                if not success:  # Should fail due to capacity constraints
-                    constraint_successes += 1
+    for i, path_id in enumerate(network.path_ids[:2]):
+        max_safe = max_safe_flows[i]
+        if max_safe > 0:  # Not blocked
+            # Try to set excessive flow (should fail); the plain setter is the
+            # enforcement point, the alternatives report would only be discarded
+            success, _ = controller.set_path_flow(path_id, max_safe * 2.0)
+            constraint_tests += 1
+            if not success:  # Should fail due to capacity constraints
+                constraint_successes += 1
     
     if constraint_tests > 0:
         constraint_rate = constraint_successes / constraint_tests
@@ -162,7 +159,7 @@ def test_network_functionality(network, name):
     
     # Test 6: Failure handling
     if network.edges:
-        edge_to_fail = list(network.edges.keys())[0]
+        edge_to_fail = network.edge_ids[0]
         original_capacity = network.edges[edge_to_fail].capacity
         
         # Force failure
@@ -244,16 +241,11 @@ def demonstrate_real_world_scenarios():
     
     # Simulate realistic loads
     target_utilization = 0.6  # 60% target utilization
-    paths_set = 0
-    for path_id in datacenter.paths.keys():
-        alternatives = controller.calculate_max_safe_flow(path_id)
-        if not alternatives.get('error') and not alternatives.get('is_blocked'):
-            max_safe = alternatives['max_safe_flow']
-            if max_safe > 0:
-                target_flow = max_safe * target_utilization
-                success, _, _ = controller.set_path_flow_with_alternatives(path_id, target_flow)
-                if success:
-                    paths_set += 1
+    bottlenecks = controller.path_bottlenecks()
+    usable = bottlenecks > 0
+    accepted = controller.set_path_flows(
+        np.where(usable, bottlenecks * target_utilization, datacenter.path_flows))
+    paths_set = int((accepted & usable).sum())
     
     total_throughput = datacenter.calculate_total_throughput()
     try:
@@ -274,15 +266,9 @@ def demonstrate_real_world_scenarios():
     
     # Test load balancing
     equal_load = 3.0
-    load_balance_success = 0
-    for path_id in cdn.paths.keys():
-        alternatives = controller2.calculate_max_safe_flow(path_id)
-        if not alternatives.get('error') and not alternatives.get('is_blocked'):
-            max_safe = alternatives['max_safe_flow']
-            if max_safe >= equal_load:
-                success, _, _ = controller2.set_path_flow_with_alternatives(path_id, equal_load)
-                if success:
-                    load_balance_success += 1
+    usable = controller2.path_bottlenecks() >= equal_load
+    accepted = controller2.set_path_flows(np.where(usable, equal_load, cdn.path_flows))
+    load_balance_success = int((accepted & usable).sum())
     
     print(f"   Load balancing: {load_balance_success}/{len(cdn.paths)} paths at {equal_load:.1f} units")
     
@@ -307,10 +293,12 @@ def main():
     print("=" * 80)
     
     # Run all tests
-    test_custom_networks()
-    test_generated_topologies()
-    test_edge_cases()
-    demonstrate_real_world_scenarios()
+    for section in (test_custom_networks,
+                    test_generated_topologies,
+                    test_edge_cases,
+                    demonstrate_real_world_scenarios):
+        section()
+        sys.stdout.flush()
     
     print("\n" + "=" * 80)
     print("🏆 GENERALITY DEMONSTRATION COMPLETE")
@@ -327,4 +315,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout; each section flushes its output when it completes
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     main()
\ No newline at end of file
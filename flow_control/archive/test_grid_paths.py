@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test actual number of paths in grid networks"""
 
+import sys
+
 from network_generators import NetworkGenerator
 from path_enumerator import CompletePathEnumerator
 
@@ -44,4 +46,6 @@ def test_grid_path_count():
     print(f"   Ratio: {result.total_paths_found / max(1, len(network.paths)):.1f}x more paths available")
 
 if __name__ == "__main__":
+    # Block-buffer stdout; the report is written out in one go at exit
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     test_grid_path_count()
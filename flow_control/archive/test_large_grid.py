@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test larger grid networks"""
 
+import sys
+
 from network_generators import NetworkGenerator
 
 def test_large_grids():
@@ -25,4 +27,6 @@ def test_large_grids():
     print(f"   Improvement: {len(network.paths) / max(1, len(network_sampled.paths)):.1f}x more paths")
 
 if __name__ == "__main__":
+    # Block-buffer stdout; the report is written out in one go at exit
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     test_large_grids()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Test updated grid generation with complete enumeration"""
 
+import sys
+
 from network_generators import NetworkGenerator
 
 def test_new_grid():
@@ -22,4 +24,6 @@ def test_new_grid():
         print(f"   {path_id}: {' → '.join(path.edges)}")
 
 if __name__ == "__main__":
+    # Block-buffer stdout; the report is written out in one go at exit
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     test_new_grid()
@@ -5,11 +5,17 @@ Test script for the new 'observe' command functionality.
 Demonstrates complete network state observation capabilities.
 """
 
+import sys
+
 from network_model import create_simple_network
 from flow_operations import FlowController
 from network_display import NetworkCUIDisplay
 
 
+# Row layouts for the state tables, bound once instead of re-parsing an f-string per row
+_EDGE_ROW = "{:<4} {:<4} {:<4} {:<8.1f} {:<8.1f} {:<9.1f} {:<6.0f} {}".format
+_PATH_ROW = "{:<4} {:<12} {:<8.1f} {:<8.1f} {:<9.1f} {:<6.0f} {}".format
+
 def test_observe_command():
     """Test the complete network state observation"""
     
@@ -47,26 +53,30 @@ def test_observe_command():
     print(f"\n🔗 Edge States:")
     print(f"{'ID':<4} {'From':<4} {'To':<4} {'Capacity':<8} {'Flow':<8} {'Available':<9} {'Util%':<6} {'Status'}")
     print("-" * 60)
+    rows = []
     for edge_id, edge_data in state['edges'].items():
         status = "FAIL" if edge_data['is_failed'] else "OK"
         util_pct = edge_data['utilization'] * 100 if edge_data['utilization'] != float('inf') else 999
-        print(f"{edge_id:<4} {edge_data['from_node']:<4} {edge_data['to_node']:<4} "
-              f"{edge_data['capacity']:<8.1f} {edge_data['current_flow']:<8.1f} "
-              f"{edge_data['available_capacity']:<9.1f} {util_pct:<6.0f} {status}")
+        rows.append(_EDGE_ROW(edge_id, edge_data['from_node'], edge_data['to_node'],
+                              edge_data['capacity'], edge_data['current_flow'],
+                              edge_data['available_capacity'], util_pct, status))
+    print("\n".join(rows))
     
     # Path details
     print(f"\n🛤️  Path States:")
     print(f"{'ID':<4} {'Edges':<12} {'Flow':<8} {'Capacity':<8} {'Available':<9} {'Util%':<6} {'Status'}")
     print("-" * 65)
+    rows = []
     for path_id, path_data in state['paths'].items():
         status = "BLOCKED" if path_data['is_blocked'] else "OK"
         edges_str = "→".join(path_data['edge_sequence'])
         util_pct = path_data['utilization'] * 100 if path_data['utilization'] != float('inf') else 999
-        print(f"{path_id:<4} {edges_str:<12} {path_data['current_flow']:<8.1f} "
-              f"{path_data['bottleneck_capacity']:<8.1f} {path_data['available_capacity']:<9.1f} "
-              f"{util_pct:<6.0f} {status}")
+        rows.append(_PATH_ROW(path_id, edges_str, path_data['current_flow'],
+                              path_data['bottleneck_capacity'], path_data['available_capacity'],
+                              util_pct, status))
         if path_data['bottleneck_edge']:
-            print(f"     └─ Bottleneck: {path_data['bottleneck_edge']}")
+            rows.append(f"     └─ Bottleneck: {path_data['bottleneck_edge']}")
+    print("\n".join(rows))
     
     # Test failure scenario
     print("\n" + "=" * 80)
@@ -120,4 +130,6 @@ def test_observe_command():
 
 
 if __name__ == "__main__":
+    # Block-buffer stdout; the report is written out in one go at exit
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
     test_observe_command()
\ No newline at end of file
@@ -6,13 +6,44 @@ Tests the effectiveness of complete path enumeration vs sampling
 for achieving theoretical max-flow in s-t networks.
 """
 
+import io
 import time
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from scipy.optimize import linprog
+
 from network_generators import NetworkGenerator
-from path_enumerator import CompletePathEnumerator, SmartPathSelector, PathAnalyzer
-from flow_operations import FlowController
+from path_enumerator import CompletePathEnumerator, SmartPathSelector, PathAnalyzer, capacity_reachable_nodes
 from maxflow_calculator import MaxFlowCalculator
-from network_model import NetworkPath
+from network_model import NetworkState
+
+
+class Welford:
+    """Running count, mean, variance, min and max of a stream of values (Welford's method)"""
+    
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def update(self, x: float):
+        """Add one value"""
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.M2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+    
+    @property
+    def variance(self) -> float:
+        """Population variance of the values seen so far"""
+        return self.M2 / self.n if self.n else 0.0
 
 
 class MaxFlowAchievabilityTester:
@@ -27,107 +58,125 @@ class MaxFlowAchievabilityTester:
         """
         Test different path enumeration strategies on various networks.
         
+        Configs are independent, so each one runs in a worker process. The
+        networks are still generated here, in order, from this tester's
+        seeded generator so every config gets the same network as a serial run.
+        
         Args:
             network_configs: List of network configuration dictionaries
             
         Returns:
             List of test results
         """
+        jobs = []
+        headers = []
+        for i, config in enumerate(network_configs):
+            network = self._create_base_network(config)
+            headers.append((f"\n🔬 Test {i+1}: {config['name']}\n{'-' * 60}\n", network is not None))
+            if network is not None:
+                jobs.append((config, network))
+        
         results = []
+        with ProcessPoolExecutor() as executor:
+            outcomes = iter(executor.map(_run_one_config, jobs))
+            for header, has_network in headers:
+                print(header, end='')
+                if has_network:
+                    test_result, log = next(outcomes)
+                    print(log, end='')
+                    results.append(test_result)
         
-        for i, config in enumerate(network_configs):
-            print(f"\n🔬 Test {i+1}: {config['name']}")
-            print("-" * 60)
-            
-            # Create base network (without paths)
-            if config['type'] == 'custom':
-                network = self.generator.create_from_edge_list(
-                    config['edges'], []  # No predefined paths
-                )
-            elif config['type'] == 'grid':
-                network = self.generator.create_grid_network(
-                    config['rows'], config['cols']
-                )
-                network.paths.clear()  # Remove existing paths
-            elif config['type'] == 'random':
-                network = self.generator.create_random_network(
-                    config['nodes'], config['edges'], 0  # No paths initially
-                )
-            else:
-                continue
-            
-            # Calculate theoretical max flow
-            max_flow_calc = MaxFlowCalculator(network)
-            theoretical_max, _ = max_flow_calc.calculate_max_flow()
-            
-            print(f"Network: {len(network.nodes)} nodes, {len(network.edges)} edges")
-            print(f"Theoretical max flow: {theoretical_max:.2f}")
-            
-            # Test different strategies
-            strategies = ['complete', 'complete_selector']
-            strategy_results = {}
-            
-            for strategy in strategies:
-                result = self._test_single_strategy(network, strategy, theoretical_max, config.get('target_paths', 10))
-                strategy_results[strategy] = result
-                
-                print(f"  {strategy:>8}: {result['paths_found']:2d} paths, "
-                      f"max achievable: {result['max_achievable']:.2f} "
-                      f"({result['max_flow_ratio']:.1%}), "
-                      f"time: {result['enumeration_time']:.3f}s")
-            
-            # Overall result
-            test_result = {
-                'config': config,
-                'theoretical_max': theoretical_max,
-                'network_size': len(network.nodes),
-                'strategies': strategy_results
-            }
-            
-            results.append(test_result)
-            
-            # Determine best strategy
-            best_ratio = 0
-            best_strategy = None
-            for strategy, data in strategy_results.items():
-                if data['max_flow_ratio'] > best_ratio:
-                    best_ratio = data['max_flow_ratio']
-                    best_strategy = strategy
+        return results
+    
+    def _create_base_network(self, config: Dict) -> Optional[NetworkState]:
+        """Create a config's base network (without paths), or None for an unknown type"""
+        if config['type'] == 'custom':
+            return self.generator.create_from_edge_list(
+                config['edges'], []  # No predefined paths
+            )
+        elif config['type'] == 'grid':
+            return self.generator.create_grid_network(
+                config['rows'], config['cols'], with_paths=False
+            )
+        elif config['type'] == 'random':
+            return self.generator.create_random_network(
+                config['nodes'], config['edges'], with_paths=False
+            )
+        return None
+    
+    def _test_config(self, config: Dict, network: NetworkState) -> Dict:
+        """Run every strategy on one config's base network"""
+        # Calculate theoretical max flow
+        max_flow_calc = MaxFlowCalculator(network)
+        theoretical_max, _ = max_flow_calc.calculate_max_flow()
+        
+        print(f"Network: {len(network.nodes)} nodes, {len(network.edges)} edges")
+        print(f"Theoretical max flow: {theoretical_max:.2f}")
+        
+        # Nodes that can still reach t through positive capacity; searches skip the rest
+        reachable = capacity_reachable_nodes(network)
+        
+        # Test different strategies
+        strategies = ['complete', 'complete_selector']
+        strategy_results = {}
+        best_ratio = 0
+        best_strategy = None
+        
+        for strategy in strategies:
+            result = self._test_single_strategy(network, strategy, theoretical_max,
+                                                config.get('target_paths', 10), reachable)
+            strategy_results[strategy] = result
+            if result['max_flow_ratio'] > best_ratio:
+                best_ratio, best_strategy = result['max_flow_ratio'], strategy
             
-            print(f"  🏆 Best: {best_strategy} ({best_ratio:.1%} of theoretical max)")
+            print(f"  {strategy:>8}: {result['paths_found']:2d} paths, "
+                  f"max achievable: {result['max_achievable']:.2f} "
+                  f"({result['max_flow_ratio']:.1%}), "
+                  f"time: {result['enumeration_time']:.3f}s")
         
-        return results
+        print(f"  🏆 Best: {best_strategy} ({best_ratio:.1%} of theoretical max)")
+        
+        # Overall result
+        return {
+            'config_name': config['name'],
+            'theoretical_max': theoretical_max,
+            'network_size': len(network.nodes),
+            'strategies': strategy_results
+        }
     
-    def _test_single_strategy(self, base_network, strategy: str, theoretical_max: float, target_paths: int) -> Dict:
+    def _test_single_strategy(self, base_network, strategy: str, theoretical_max: float, target_paths: int,
+                              reachable: Optional[Set[str]] = None) -> Dict:
         """Test a single path enumeration strategy"""
-        # Create fresh copy of network
-        network = self._copy_network(base_network)
-        
-        start_time = time.time()
+        network = base_network
+        start_ns = time.perf_counter_ns()
         
         if strategy == 'complete':
-            enumerator = CompletePathEnumerator(network)
+            enumerator = CompletePathEnumerator(network, reachable)
             result = enumerator.enumerate_all_paths(
                 max_length=len(network.nodes) + 2,
                 max_paths=min(target_paths * 3, 100)  # Reasonable limit
             )
             paths = result.paths
-            enumeration_time = result.enumeration_time
             
         elif strategy == 'complete_selector':
-            selector = SmartPathSelector(network)
+            selector = SmartPathSelector(network, reachable)
             result = selector.enumerate_all_paths(max_paths=target_paths)
             paths = result.paths
-            enumeration_time = result.enumeration_time
         
-        # Add paths to network
-        network.paths.clear()
-        for i, path_edges in enumerate(paths):
-            path = NetworkPath(f"P{i+1}", path_edges)
-            network.add_path(path)
+        # Monotonic integer clock; converted to seconds only here
+        enumeration_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-        # Test max flow achievability
-        max_achievable = self._calculate_max_achievable_flow(network)
+        # Swap the paths into the base network itself; its own paths and flows
+        # are put back even if the achievability check fails
+        snapshot = self._snapshot(network)
+        try:
+            network.clear_paths()
+            network.add_paths_batch(paths)
+            
+            # Test max flow achievability
+            max_achievable = self._calculate_max_achievable_flow(network)
+        finally:
+            self._restore(network, snapshot)
         max_flow_ratio = (max_achievable / theoretical_max) if theoretical_max > 0 else 0
         
         return {
@@ -138,49 +187,40 @@ class MaxFlowAchievabilityTester:
             'is_complete': strategy == 'complete'
         }
     
-    def _copy_network(self, network):
-        """Create a copy of network without paths"""
-        from network_model import NetworkState
-        
-        new_network = NetworkState()
-        
-        # Copy nodes
-        for node in network.nodes.values():
-            new_network.add_node(node)
-        
-        # Copy edges
-        for edge in network.edges.values():
-            new_network.add_edge(edge)
-        
-        return new_network
+    def _snapshot(self, network) -> Tuple[Dict, np.ndarray, np.ndarray]:
+        """Save the state a strategy run mutates: the path set and path/edge flows"""
+        return dict(network.paths), network.path_flows.copy(), network.edge_flows.copy()
+    
+    def _restore(self, network, snapshot: Tuple[Dict, np.ndarray, np.ndarray]):
+        """Put back the paths and flows saved by _snapshot"""
+        paths, path_flows, edge_flows = snapshot
+        network.clear_paths()
+        for path in paths.values():
+            network.add_path(path)
+        network.path_flows[:len(path_flows)] = path_flows
+        network.edge_flows[:] = edge_flows
     
     def _calculate_max_achievable_flow(self, network) -> float:
         """
         Calculate maximum achievable flow using the available paths.
-        This uses a greedy approach to set path flows.
-        """
-        controller = FlowController(network)
-        
-        # Sort paths by bottleneck capacity (largest first)
-        path_capacities = []
-        for path_id, path in network.paths.items():
-            bottleneck, _ = path.calculate_bottleneck(network.edges)
-            path_capacities.append((path_id, bottleneck))
         
-        path_capacities.sort(key=lambda x: x[1], reverse=True)
+        Solves the path-flow LP max sum f_p s.t. sum_{p on e} f_p <= cap(e),
+        f_p >= 0, so only the given paths carry flow and shared edges are
+        counted against their capacity once.
+        """
+        if not network.paths:
+            return 0.0
         
-        # Greedily set flows
-        total_flow = 0
-        for path_id, capacity in path_capacities:
-            alternatives = controller.calculate_max_safe_flow(path_id)
-            if not alternatives.get('error') and not alternatives.get('is_blocked'):
-                max_safe = alternatives['max_safe_flow']
-                if max_safe > 0:
-                    success, _, _ = controller.set_path_flow_with_alternatives(path_id, max_safe)
-                    if success:
-                        total_flow += max_safe
+        # Edge-path incidence: row per edge slot, column per path
+        edge_rows = {edge_id: i for i, edge_id in enumerate(network.edge_ids)}
+        incidence = np.zeros((len(network.edge_ids), len(network.path_ids)))
+        for j, path_id in enumerate(network.path_ids):
+            for edge_id in network.paths[path_id].edges:
+                incidence[edge_rows[edge_id], j] = 1.0
         
-        return total_flow
+        solution = linprog(-np.ones(len(network.path_ids)), A_ub=incidence,
+                           b_ub=network.edge_capacities, bounds=(0, None), method='highs')
+        return float(-solution.fun) if solution.success else 0.0
     
     def generate_comparison_report(self, results: List[Dict]):
         """Generate comprehensive comparison report"""
@@ -192,52 +232,41 @@ class MaxFlowAchievabilityTester:
             print("No test results available.")
             return
         
-        # Summary statistics
-        strategy_stats = {'complete': [], 'smart': [], 'sample': []}
+        # One pass: overall and per-size-bucket running stats for each strategy
+        strategies = ('complete', 'smart', 'sample')
+        buckets = ("Small (≤6 nodes)", "Medium (7-12 nodes)", "Large (>12 nodes)")
+        strategy_stats = {strategy: Welford() for strategy in strategies}
+        bucket_stats = {(bucket, strategy): Welford() for bucket in buckets for strategy in strategies}
+        bucket_counts = dict.fromkeys(buckets, 0)
         
         for result in results:
+            size = result['network_size']
+            bucket = buckets[0] if size <= 6 else buckets[1] if size <= 12 else buckets[2]
+            bucket_counts[bucket] += 1
             for strategy, data in result['strategies'].items():
                 if strategy in strategy_stats:
-                    strategy_stats[strategy].append(data['max_flow_ratio'])
+                    strategy_stats[strategy].update(data['max_flow_ratio'])
+                    bucket_stats[bucket, strategy].update(data['max_flow_ratio'])
         
         print("\n📊 Strategy Performance Summary:")
         print(f"{'Strategy':<12} {'Tests':<6} {'Avg Ratio':<10} {'Min':<8} {'Max':<8} {'Std Dev':<8}")
         print("-" * 60)
         
-        for strategy, ratios in strategy_stats.items():
-            if ratios:
-                avg_ratio = sum(ratios) / len(ratios)
-                min_ratio = min(ratios)
-                max_ratio = max(ratios)
-                std_dev = (sum((r - avg_ratio) ** 2 for r in ratios) / len(ratios)) ** 0.5
-                
-                print(f"{strategy:<12} {len(ratios):<6} {avg_ratio:<10.1%} "
-                      f"{min_ratio:<8.1%} {max_ratio:<8.1%} {std_dev:<8.3f}")
+        for strategy, stats in strategy_stats.items():
+            if stats.n:
+                print(f"{strategy:<12} {stats.n:<6} {stats.mean:<10.1%} "
+                      f"{stats.min:<8.1%} {stats.max:<8.1%} {stats.variance ** 0.5:<8.3f}")
         
         # Detailed analysis
         print("\n🔍 Detailed Analysis by Network Size:")
-        small_networks = [r for r in results if r['network_size'] <= 6]
-        medium_networks = [r for r in results if 6 < r['network_size'] <= 12]
-        large_networks = [r for r in results if r['network_size'] > 12]
-        
-        for category, networks in [("Small (≤6 nodes)", small_networks), 
-                                  ("Medium (7-12 nodes)", medium_networks),
-                                  ("Large (>12 nodes)", large_networks)]:
-            if networks:
-                print(f"\n{category}:")
-                complete_ratios = [n['strategies']['complete']['max_flow_ratio'] 
-                                 for n in networks if 'complete' in n['strategies']]
-                smart_ratios = [n['strategies']['smart']['max_flow_ratio'] 
-                               for n in networks if 'smart' in n['strategies']]
-                sample_ratios = [n['strategies']['sample']['max_flow_ratio'] 
-                               for n in networks if 'sample' in n['strategies']]
-                
-                if complete_ratios:
-                    print(f"  Complete: {sum(complete_ratios)/len(complete_ratios):.1%} avg")
-                if smart_ratios:
-                    print(f"  Smart:    {sum(smart_ratios)/len(smart_ratios):.1%} avg")
-                if sample_ratios:
-                    print(f"  Sample:   {sum(sample_ratios)/len(sample_ratios):.1%} avg")
+        labels = {'complete': "Complete:", 'smart': "Smart:   ", 'sample': "Sample:  "}
+        for bucket in buckets:
+            if bucket_counts[bucket]:
+                print(f"\n{bucket}:")
+                for strategy in strategies:
+                    stats = bucket_stats[bucket, strategy]
+                    if stats.n:
+                        print(f"  {labels[strategy]} {stats.mean:.1%} avg")
         
         # Recommendations
         print("\n💡 Recommendations:")
@@ -247,6 +276,15 @@ class MaxFlowAchievabilityTester:
         print("  • Max-flow critical applications: Always prefer 'complete' when feasible")
 
 
+def _run_one_config(job: Tuple[Dict, NetworkState]) -> Tuple[Dict, str]:
+    """Worker entry point: test one config and return its result with everything it printed"""
+    config, network = job
+    log = io.StringIO()
+    with redirect_stdout(log):
+        test_result = MaxFlowAchievabilityTester()._test_config(config, network)
+    return test_result, log.getvalue()
+
+
 def main():
     """Run comprehensive path enumeration tests"""
     print("🛤️  PATH ENUMERATION STRATEGY TESTING")
@@ -6,6 +6,8 @@ Tests the new planar layout algorithms for s-t networks,
 focusing on minimal crossings and proper s-t placement.
 """
 
+import numpy as np
+
 from network_generators import NetworkGenerator
 from flow_operations import FlowController
 from network_visualizer import display_network, NetworkGraphVisualizer
@@ -51,7 +53,7 @@ def test_planar_layouts():
         # Set some flows for visualization
         controller = FlowController(network)
         if network.paths:
-            path_ids = list(network.paths.keys())[:2]
+            path_ids = network.path_ids[:2]
             for path_id in path_ids:
                 alternatives = controller.calculate_max_safe_flow(path_id)
                 if not alternatives.get('error'):
@@ -59,10 +61,10 @@ def test_planar_layouts():
                     if max_safe > 0:
                         controller.set_path_flow_with_alternatives(path_id, max_safe * 0.6)
         
-        # Test each layout
+        # Test each layout on one visualizer, so planar strategies share their embedding
+        visualizer = NetworkGraphVisualizer(network)
         for layout in layout_types:
             try:
-                visualizer = NetworkGraphVisualizer(network)
                 pos = visualizer._determine_layout(layout)
                 
                 # Check s-t placement
@@ -120,9 +122,8 @@ def test_planar_graph_detection():
             network = generator.create_from_edge_list(test_case['edges'], test_case['paths'])
             visualizer = NetworkGraphVisualizer(network)
             
-            # Check planarity
-            import networkx as nx
-            is_planar = nx.is_planar(visualizer.nx_graph)
+            # Check planarity (the visualizer keeps the embedding for its planar layouts)
+            is_planar = visualizer.is_planar
             expected = test_case['expected_planar']
             
             status = "✅" if is_planar == expected else "⚠️"
@@ -181,12 +182,15 @@ def test_crossing_minimization():
     
     visualizer = NetworkGraphVisualizer(network)
     
+    # Edge endpoints don't depend on the layout, so collect them once
+    edge_endpoints = [(edge.from_node, edge.to_node) for edge in network.edge_list]
+    
     for layout in layouts:
         try:
             pos = visualizer._determine_layout(layout)
             
             # Simple heuristic to estimate crossings
-            crossings = estimate_crossings(network, pos)
+            crossings = estimate_crossings(edge_endpoints, pos)
             
             # Check s-t placement
             s_x = pos.get('s', (0, 0))[0]
@@ -200,34 +204,49 @@ def test_crossing_minimization():
             print(f"   ❌ {layout:>12}: Error - {str(e)[:30]}")
 
 
-def estimate_crossings(network, pos):
-    """Simple heuristic to estimate edge crossings"""
+def estimate_crossings(edge_endpoints, pos):
+    """Simple heuristic to estimate edge crossings between (from_node, to_node) pairs"""
     if len(pos) < 4:
         return 0
     
-    edges = [(network.edges[eid].from_node, network.edges[eid].to_node) 
-             for eid in network.edges]
+    edges = [(a, b) for a, b in edge_endpoints if a in pos and b in pos]
+    if len(edges) < 2:
+        return 0
     
-    crossings = 0
-    for i, (a1, a2) in enumerate(edges):
-        for j, (b1, b2) in enumerate(edges[i+1:], i+1):
-            if {a1, a2} & {b1, b2}:  # Edges share a node
-                continue
-            
-            # Check if line segments intersect
-            if all(node in pos for node in [a1, a2, b1, b2]):
-                if segments_intersect(pos[a1], pos[a2], pos[b1], pos[b2]):
-                    crossings += 1
+    # Segment endpoints as (E, 2) arrays plus node ids for the shared-node test
+    node_ids = {node: k for k, node in enumerate(pos)}
+    ends = np.array([(node_ids[a], node_ids[b]) for a, b in edges])
+    coords = np.array([pos[node] for node in pos], dtype=float)
+    p1, p2 = coords[ends[:, 0]], coords[ends[:, 1]]
     
-    return crossings
-
-
-def segments_intersect(p1, p2, p3, p4):
-    """Check if two line segments intersect"""
+    # Sweep along x: a segment can only cross segments whose x-range starts
+    # before its own ends, so only those candidate pairs get tested
+    xmin = np.minimum(p1[:, 0], p2[:, 0])
+    xmax = np.maximum(p1[:, 0], p2[:, 0])
+    order = np.argsort(xmin, kind='stable')
+    stop = np.searchsorted(xmin[order], xmax[order], side='right')
+    counts = np.maximum(stop - np.arange(len(order)) - 1, 0)
+    if not counts.any():
+        return 0
+    first = np.repeat(np.arange(len(order)), counts)
+    step = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    i, j = order[first], order[first + 1 + step]
+    
+    # Edges sharing a node never count as crossing
+    shared = ((ends[i, 0] == ends[j, 0]) | (ends[i, 0] == ends[j, 1]) |
+              (ends[i, 1] == ends[j, 0]) | (ends[i, 1] == ends[j, 1]))
+    i, j = i[~shared], j[~shared]
+    
+    # CCW tests over the candidate pairs
     def ccw(A, B, C):
-        return (C[1] - A[1]) * (B[0] - A[0]) > (B[1] - A[1]) * (C[0] - A[0])
+        return ((C[:, 1] - A[:, 1]) * (B[:, 0] - A[:, 0]) >
+                (B[:, 1] - A[:, 1]) * (C[:, 0] - A[:, 0]))
+    
+    a1, a2, b1, b2 = p1[i], p2[i], p1[j], p2[j]
+    intersect = ((ccw(a1, b1, b2) != ccw(a2, b1, b2)) &
+                 (ccw(a1, a2, b1) != ccw(a1, a2, b2)))
     
-    return ccw(p1, p3, p4) != ccw(p2, p3, p4) and ccw(p1, p2, p3) != ccw(p1, p2, p4)
+    return int(intersect.sum())
 
 
 def main():
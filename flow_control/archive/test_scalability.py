@@ -7,9 +7,11 @@ to verify the generality and scalability of the implementation.
 """
 
 import time
+from itertools import islice
 from typing import Dict, List, Tuple
 from network_generators import NetworkGenerator
 from flow_operations import FlowController
+from maxflow_calculator import MaxFlowCalculator
 from network_display import NetworkCUIDisplay
 
 
@@ -21,15 +23,22 @@ class ScalabilityTester:
         self.generator = NetworkGenerator(seed=42)
         self.results = []
     
-    def measure_performance(self, func, *args, **kwargs) -> Tuple[float, any]:
-        """Measure execution time of a function"""
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
+    def measure_performance(self, func, *args, repeat: int = 1, **kwargs) -> Tuple[float, any]:
+        """
+        Measure execution time of a function.
         
-        execution_time = end_time - start_time
+        With repeat > 1 the function runs that many times and the fastest
+        run is reported (as timeit does), with the last run's result.
+        """
+        best_ns = None
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter_ns()
+            result = func(*args, **kwargs)
+            elapsed_ns = time.perf_counter_ns() - start
+            if best_ns is None or elapsed_ns < best_ns:
+                best_ns = elapsed_ns
         
-        return execution_time, result
+        return best_ns * 1e-9, result
     
     def test_network_creation_scaling(self):
         """Test network creation performance at different scales"""
@@ -112,12 +121,11 @@ class ScalabilityTester:
                 
                 # Test state observation
                 obs_time, _ = self.measure_performance(
-                    controller.get_complete_network_state
+                    controller.get_complete_network_state, repeat=5  # Read-only, sub-ms
                 )
                 
                 # Test max flow calculation
                 try:
-                    from maxflow_calculator import MaxFlowCalculator
                     calc = MaxFlowCalculator(network)
                     max_time, _ = self.measure_performance(
                         calc.calculate_max_flow
@@ -167,7 +175,7 @@ class ScalabilityTester:
                 
                 # Test observation
                 obs_time, _ = self.measure_performance(
-                    controller.get_complete_network_state
+                    controller.get_complete_network_state, repeat=5  # Read-only, sub-ms
                 )
                 
                 status = "✅ OK"
@@ -228,9 +236,7 @@ class ScalabilityTester:
         if not controller.network.paths:
             return
         
-        path_ids = list(controller.network.paths.keys())
-        for i in range(min(num_operations, len(path_ids))):
-            path_id = path_ids[i]
+        for path_id in islice(controller.network.paths, num_operations):
             alternatives = controller.calculate_max_safe_flow(path_id)
             if not alternatives.get('error') and not alternatives.get('is_blocked'):
                 max_safe = alternatives['max_safe_flow']
@@ -239,7 +245,7 @@ class ScalabilityTester:
     
     def _test_valid_flow_sets(self, controller: FlowController):
         """Helper: test valid flow settings"""
-        for path_id in list(controller.network.paths.keys())[:5]:
+        for path_id in islice(controller.network.paths, 5):
             alternatives = controller.calculate_max_safe_flow(path_id)
             if not alternatives.get('error') and not alternatives.get('is_blocked'):
                 max_safe = alternatives['max_safe_flow']
@@ -248,7 +254,7 @@ class ScalabilityTester:
     
     def _test_invalid_flow_sets(self, controller: FlowController):
         """Helper: test invalid flow settings (should trigger alternatives)"""
-        for path_id in list(controller.network.paths.keys())[:3]:
+        for path_id in islice(controller.network.paths, 3):
             alternatives = controller.calculate_max_safe_flow(path_id)
             if not alternatives.get('error') and not alternatives.get('is_blocked'):
                 max_safe = alternatives['max_safe_flow']
@@ -258,8 +264,7 @@ class ScalabilityTester:
     
     def _test_alternatives_calculation(self, controller: FlowController):
         """Helper: test alternatives calculation for all paths"""
-        for path_id in controller.network.paths.keys():
-            controller.calculate_max_safe_flow(path_id)
+        controller.calculate_all_max_safe_flows()
     
     def generate_performance_report(self):
         """Generate performance summary report"""
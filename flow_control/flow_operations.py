@@ -7,6 +7,9 @@ in the s-t network flow control problem.
 """
 
 from typing import Dict, List, Tuple, Optional
+
+import numpy as np
+
 from network_model import NetworkState, NetworkPath, NetworkEdge, NetworkNode
 
 
@@ -77,6 +80,26 @@ class FlowController:
         
         return self.update_path_flow(path_id, delta_flow)
     
+    def apply_adjustments(self, adjustments: List[Tuple[str, float]]) -> List[Tuple[bool, str, List[float]]]:
+        """
+        Apply a sequence of path flow changes in order.
+        
+        Derived state (alerts, throughput) is left to the caller so it can be
+        recomputed once after the whole batch instead of after every change.
+        
+        Args:
+            adjustments: List of (path_id, delta_flow) pairs
+            
+        Returns:
+            List of (success, message, path_flows) per adjustment, where
+            path_flows is a snapshot of network.path_flows after that step
+        """
+        results = []
+        for path_id, delta_flow in adjustments:
+            success, message = self.update_path_flow(path_id, delta_flow)
+            results.append((success, message, self.network.path_flows.tolist()))
+        return results
+    
     def clear_all_flows(self) -> None:
         """Reset all flows to zero"""
         for edge in self.network.edges.values():
@@ -146,20 +169,16 @@ class FlowController:
         Returns:
             Tuple of (number of paths affected, list of affected path IDs)
         """
-        affected_paths = set()
+        path_ids = self.network.path_ids
+        offsets, slots = self.network._get_path_edge_index()
         
         # Find all failed edges
-        failed_edges = []
-        for edge_id, edge in self.network.edges.items():
-            if edge.is_failed or edge.capacity == 0:
-                failed_edges.append(edge_id)
+        failed = self.network.edge_failed | (self.network.edge_capacities == 0)
         
-        # Find all paths using failed edges
-        for path_id, path in self.network.paths.items():
-            for edge_id in path.edges:
-                if edge_id in failed_edges:
-                    affected_paths.add(path_id)
-                    break
+        # Count failed edges per path from prefix sums over the CSR path -> edge index
+        failed_prefix = np.concatenate(([0], np.cumsum(failed[slots])))
+        hit = failed_prefix[offsets[1:]] > failed_prefix[offsets[:-1]]
+        affected_paths = [path_ids[i] for i in np.flatnonzero(hit)]
         
         # Zero the flow on affected paths
         zeroed_paths = []
@@ -210,6 +229,130 @@ class FlowController:
             'is_blocked': bottleneck_capacity <= 0
         }
     
+    def calculate_all_max_safe_flows(self) -> Dict[str, Dict]:
+        """
+        Calculate maximum safe flow for every path in one pass.
+        
+        Bottlenecks and bottleneck edges come from a single reduction over
+        the network's capacity array instead of one lookup per path.
+        
+        Returns:
+            Dictionary mapping each path ID to the dictionary
+            calculate_max_safe_flow returns for it
+        """
+        network = self.network
+        offsets, slots = network._get_path_edge_index()
+        bottlenecks = self.path_bottlenecks()
+        flows = network.path_flows
+        
+        # Position of the first edge on each path that attains its bottleneck
+        lengths = np.diff(offsets)
+        nonempty = lengths > 0
+        first = np.zeros(len(lengths), dtype=np.intp)
+        if nonempty.any():
+            segment = np.repeat(np.arange(len(lengths)), lengths)
+            at_min = network.edge_capacities[slots] == bottlenecks[segment]
+            positions = np.where(at_min, np.arange(len(slots)), len(slots))
+            first[nonempty] = np.minimum.reduceat(positions, offsets[:-1][nonempty])
+        
+        results = {}
+        for path_id, path in network.paths.items():
+            index = network._path_index[path_id]
+            bottleneck_capacity = float(bottlenecks[index])
+            bottleneck_edge = network.edge_ids[slots[first[index]]] if nonempty[index] else None
+            current_flow = float(flows[index])
+            available_capacity = max(0, bottleneck_capacity - current_flow)
+            
+            results[path_id] = {
+                'path_id': path_id,
+                'current_flow': current_flow,
+                'max_safe_flow': bottleneck_capacity,
+                'available_capacity': available_capacity,
+                'suggested_flow': min(current_flow + available_capacity, bottleneck_capacity),
+                'bottleneck_edge': bottleneck_edge,
+                'bottleneck_capacity': bottleneck_capacity,
+                'edge_sequence': path.edges,
+                'is_blocked': bottleneck_capacity <= 0
+            }
+        
+        return results
+    
+    def evaluate_flows_batch(self, path_id: str, flows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate several candidate target flows for a path in one pass.
+        
+        Applies the same capacity rule as set_path_flow to every candidate
+        without changing any flows.
+        
+        Args:
+            path_id: ID of path to evaluate
+            flows: Array of candidate target flows
+            
+        Returns:
+            Tuple of (ok_mask, available_capacity) arrays, one entry per candidate
+        """
+        if path_id not in self.network.paths:
+            raise KeyError(f"Path {path_id} not found")
+        
+        path = self.network.paths[path_id]
+        flows = np.asarray(flows, dtype=float)
+        bottleneck, _ = path.calculate_bottleneck(self.network.edges)
+        
+        # Decreases are always allowed; increases must fit an unblocked bottleneck
+        ok_mask = (flows >= 0) & ((flows <= path.current_flow) |
+                                  ((bottleneck > 0) & (flows <= bottleneck)))
+        available = np.maximum(0, bottleneck - flows)
+        
+        return ok_mask, available
+    
+    def path_bottlenecks(self) -> np.ndarray:
+        """
+        Bottleneck capacity of every path, indexed like network.path_ids.
+        
+        Returns:
+            Array of minimum edge capacities (0 for paths without edges)
+        """
+        offsets, slots = self.network._get_path_edge_index()
+        bottlenecks = np.zeros(len(offsets) - 1)
+        
+        # Reduce only non-empty segments; empty ones would read their neighbour's first edge
+        nonempty = np.diff(offsets) > 0
+        if nonempty.any():
+            bottlenecks[nonempty] = np.minimum.reduceat(
+                self.network.edge_capacities[slots], offsets[:-1][nonempty])
+        return bottlenecks
+    
+    def set_path_flows(self, targets: np.ndarray) -> np.ndarray:
+        """
+        Set absolute flows on all paths in one pass.
+        
+        Each path is accepted or rejected by the same capacity rule as
+        set_path_flow; rejected paths keep their current flow.
+        
+        Args:
+            targets: Target flows, indexed like network.path_ids
+            
+        Returns:
+            Boolean mask of the paths whose flow was set
+        """
+        targets = np.asarray(targets, dtype=float)
+        current = self.network.path_flows
+        bottlenecks = self.path_bottlenecks()
+        
+        # Decreases are always allowed; increases must fit an unblocked bottleneck
+        ok_mask = (targets >= 0) & ((targets <= current) |
+                                    ((bottlenecks > 0) & (targets <= bottlenecks)))
+        delta = np.where(ok_mask, targets - current, 0.0)
+        
+        # Spread each path's change over its edges, then clamp like update_path_flow
+        offsets, slots = self.network._get_path_edge_index()
+        edge_flows = self.network.edge_flows
+        np.add.at(edge_flows, slots, np.repeat(delta, np.diff(offsets)))
+        edge_flows[slots] = np.maximum(0.0, edge_flows[slots])
+        current[ok_mask] = np.maximum(0.0, current[ok_mask] + delta[ok_mask])
+        
+        return ok_mask
+    
     def set_path_flow_with_alternatives(self, path_id: str, target_flow: float) -> Tuple[bool, str, Dict]:
         """
         Set path flow with detailed alternatives on failure.
@@ -449,17 +592,28 @@ class FlowController:
             'system_metrics': {},
         }
         
-        # Complete edge information
-        for edge_id, edge in self.network.edges.items():
+        # Complete edge information, read from the network's edge arrays in one gather
+        slots = [self.network._edge_index[edge_id] for edge_id in self.network.edges]
+        capacities = self.network.edge_capacities[slots]
+        flows = self.network.edge_flows[slots]
+        failed = self.network.edge_failed[slots]
+        # Same rule as NetworkEdge.get_utilization for zero-capacity edges
+        utilizations = np.divide(flows, capacities, out=np.where(flows > 0, np.inf, 0.0),
+                                 where=capacities > 0)
+        available = np.maximum(0, capacities - flows)
+        
+        for (edge_id, edge), capacity, flow, is_failed, utilization, available_capacity in zip(
+                self.network.edges.items(), capacities.tolist(), flows.tolist(), failed.tolist(),
+                utilizations.tolist(), available.tolist()):
             state['edges'][edge_id] = {
                 'from_node': edge.from_node,
                 'to_node': edge.to_node,
-                'capacity': edge.capacity,
-                'current_flow': edge.flow,
+                'capacity': capacity,
+                'current_flow': flow,
                 'base_capacity': edge.base_capacity,
-                'is_failed': edge.is_failed,
-                'utilization': edge.get_utilization(),
-                'available_capacity': max(0, edge.capacity - edge.flow)
+                'is_failed': is_failed,
+                'utilization': utilization,
+                'available_capacity': available_capacity
             }
         
         # Complete path information
@@ -493,8 +647,8 @@ class FlowController:
             'theoretical_max_flow': max_flow_value,
             'network_efficiency': (total_throughput / max_flow_value) if max_flow_value > 0 else 0.0,
             'flow_conservation_violations': len(violations),
-            'operational_edges': len([e for e in self.network.edges.values() if not e.is_failed]),
-            'failed_edges': len([e for e in self.network.edges.values() if e.is_failed]),
+            'operational_edges': int(len(failed) - failed.sum()),
+            'failed_edges': int(failed.sum()),
             'blocked_paths': len([p for p_id, p in state['paths'].items() if p['is_blocked']])
         }
         
@@ -6,13 +6,22 @@ Calculates theoretical maximum flow using min-cut max-flow theorem.
 Uses NetworkX's max flow algorithms for accurate computation.
 """
 
+import weakref
+
 import networkx as nx
+from networkx.algorithms.flow import build_flow_dict, preflow_push
 from typing import Dict, Tuple, Optional
 from network_model import NetworkState, create_simple_network
 from flow_operations import FlowController
 from network_display import NetworkCUIDisplay
 
 
+# Latest (capacity_version, topology_version, nx_graph, residual) per network, so
+# calculators created for an unchanged network share one push-relabel solve and a
+# network whose capacities changed only refreshes capacities on a copy of the graph
+_SOLVE_CACHE = weakref.WeakKeyDictionary()
+
+
 class MaxFlowCalculator:
     """Calculate theoretical maximum flow for network"""
     
@@ -20,6 +29,7 @@ class MaxFlowCalculator:
         """Initialize max flow calculator"""
         self.network = network
         self.nx_graph = None
+        self.residual = None  # Push-relabel residual network, shared by flow and cut queries
         self.max_flow_value = None
         self.min_cut = None
     
@@ -31,34 +41,70 @@ class MaxFlowCalculator:
         for node_id in self.network.nodes:
             G.add_node(node_id)
         
-        # Add edges with capacity
-        for edge_id, edge in self.network.edges.items():
-            G.add_edge(edge.from_node, edge.to_node, 
-                      capacity=edge.capacity, 
-                      edge_id=edge_id)
+        # Add edges with capacity, read off the network's slot-indexed edge arrays
+        capacities = self.network.edge_capacities.tolist()
+        G.add_edges_from(
+            (edge.from_node, edge.to_node, {'capacity': capacity, 'edge_id': edge_id})
+            for edge_id, edge, capacity in zip(self.network.edge_ids, self.network.edge_list, capacities)
+        )
         
         self.nx_graph = G
         return G
     
-    def calculate_max_flow(self) -> Tuple[float, Dict]:
+    def _refresh_capacities(self):
+        """Copy current edge capacities onto an nx_graph built for the same topology"""
+        adjacency = self.nx_graph.adj
+        capacities = self.network.edge_capacities.tolist()
+        for edge, capacity in zip(self.network.edge_list, capacities):
+            adjacency[edge.from_node][edge.to_node]['capacity'] = capacity
+    
+    def _solve(self) -> nx.DiGraph:
         """
-        Calculate maximum flow using NetworkX's algorithms.
+        Run highest-label push-relabel (with gap and global relabeling) once.
         
         Returns:
-            Tuple of (max_flow_value, flow_dict)
+            Residual network holding the max flow, reused by later queries
         """
+        if self.residual is not None:
+            return self.residual
+        
+        version = self.network._capacity_version
+        topology = self.network._topology_version
+        cached = _SOLVE_CACHE.get(self.network)
+        if self.nx_graph is None and cached is not None:
+            cached_version, cached_topology, graph, residual = cached
+            if cached_version == version:
+                self.nx_graph, self.residual = graph, residual
+                return self.residual
+            if cached_topology == topology:
+                # Copy so earlier calculators keep the capacities they solved with
+                self.nx_graph = graph.copy()
+                self._refresh_capacities()
+        
         if self.nx_graph is None:
             self.build_nx_graph()
         
+        self.residual = preflow_push(
+            self.nx_graph,
+            self.network.source_node,
+            self.network.sink_node
+        )
+        _SOLVE_CACHE[self.network] = (version, topology, self.nx_graph, self.residual)
+        return self.residual
+    
+    def calculate_max_flow(self) -> Tuple[float, Dict]:
+        """
+        Calculate maximum flow using NetworkX's push-relabel algorithm.
+        
+        Returns:
+            Tuple of (max_flow_value, flow_dict)
+        """
         if not self.network.source_node or not self.network.sink_node:
             return 0.0, {}
         
-        # Calculate max flow
-        flow_value, flow_dict = nx.maximum_flow(
-            self.nx_graph, 
-            self.network.source_node, 
-            self.network.sink_node
-        )
+        residual = self._solve()
+        flow_value = residual.graph['flow_value']
+        flow_dict = build_flow_dict(self.nx_graph, residual)
         
         self.max_flow_value = flow_value
         return flow_value, flow_dict
@@ -70,18 +116,22 @@ class MaxFlowCalculator:
         Returns:
             Tuple of (cut_value, (source_partition, sink_partition))
         """
-        if self.nx_graph is None:
-            self.build_nx_graph()
-        
         if not self.network.source_node or not self.network.sink_node:
             return 0.0, (set(), set())
         
-        # Find min cut
-        cut_value, partition = nx.minimum_cut(
-            self.nx_graph,
-            self.network.source_node,
-            self.network.sink_node
-        )
+        # Read the cut off the max-flow residual instead of solving again:
+        # the sink side is every node that still reaches the sink without
+        # crossing a saturated arc
+        residual = self._solve()
+        saturated = {(u, v) for u, v, d in residual.edges(data=True)
+                     if d['flow'] == d['capacity']}
+        unsaturated = residual.edge_subgraph(
+            edge for edge in residual.edges if edge not in saturated)
+        sink_partition = {self.network.sink_node}
+        if self.network.sink_node in unsaturated:
+            sink_partition |= nx.ancestors(unsaturated, self.network.sink_node)
+        partition = (set(self.nx_graph) - sink_partition, sink_partition)
+        cut_value = residual.graph['flow_value']
         
         self.min_cut = (cut_value, partition)
         return cut_value, partition
@@ -8,7 +8,7 @@ Load network definitions from YAML files for custom network topologies.
 import yaml
 from pathlib import Path
 from typing import Dict, Any
-from network_model import NetworkState, NetworkNode, NetworkEdge, NetworkPath
+from network_model import NetworkState, NetworkNode, NetworkEdge
 from path_enumerator import CompletePathEnumerator
 
 
@@ -121,10 +121,7 @@ class NetworkFileLoader:
         result = path_enumerator.enumerate_all_paths()
         
         # Add paths to network
-        for i, path_edges in enumerate(result.paths, 1):
-            path_id = f"P{i}"
-            network_path = NetworkPath(path_id, path_edges)
-            network.add_path(network_path)
+        network.add_paths_batch(result.paths)
         
         # Validate connectivity
         if len(network.paths) == 0:
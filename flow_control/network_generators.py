@@ -12,6 +12,13 @@ from typing import List, Tuple, Dict, Optional
 from network_model import NetworkState, NetworkNode, NetworkEdge, NetworkPath
 
 
+# Enumerated paths (as immutable edge-ID tuples) keyed by (topology, max_paths) for
+# generators whose topology depends only on their arguments; capacities are never
+# part of the key. Least recently used entries are evicted past _PATH_CACHE_SIZE.
+_PATH_CACHE_SIZE = 32
+_PATH_CACHE: Dict[tuple, Tuple[Tuple[str, ...], ...]] = {}
+
+
 class NetworkGenerator:
     """Universal network generator for various topologies"""
     
@@ -25,7 +32,8 @@ class NetworkGenerator:
                             num_edges: int = 20, 
                             max_paths: int = None,
                             min_capacity: float = 1.0,
-                            max_capacity: float = 10.0) -> NetworkState:
+                            max_capacity: float = 10.0,
+                            with_paths: bool = True) -> NetworkState:
         """
         Create a random s-t network.
         
@@ -35,6 +43,7 @@ class NetworkGenerator:
             max_paths: Maximum paths to enumerate (None = no limit)
             min_capacity: Minimum edge capacity
             max_capacity: Maximum edge capacity
+            with_paths: Enumerate s-t paths; False leaves the network without paths
             
         Returns:
             NetworkState with random topology
@@ -99,7 +108,8 @@ class NetworkGenerator:
                 edge_count += 1
         
         # Generate all possible s-t paths
-        self._generate_complete_paths(network, max_paths)
+        if with_paths:
+            self._generate_complete_paths(network, max_paths)
         
         return network
     
@@ -107,7 +117,8 @@ class NetworkGenerator:
                           rows: int = 3, 
                           cols: int = 4,
                           capacity_range: Tuple[float, float] = (1.0, 10.0),
-                          max_paths: int = None) -> NetworkState:
+                          max_paths: int = None,
+                          with_paths: bool = True) -> NetworkState:
         """
         Create a grid-based s-t network.
         
@@ -116,6 +127,7 @@ class NetworkGenerator:
             cols: Number of columns in grid
             capacity_range: (min, max) capacity for edges
             max_paths: Maximum paths to enumerate (None = no limit)
+            with_paths: Enumerate s-t paths; False leaves the network without paths
             
         Returns:
             NetworkState with grid topology
@@ -162,7 +174,8 @@ class NetworkGenerator:
                     edge_count += 1
         
         # Generate all possible paths through grid
-        self._generate_complete_paths(network, max_paths)
+        if with_paths:
+            self._generate_complete_paths(network, max_paths, ('grid', rows, cols))
         
         return network
     
@@ -209,10 +222,7 @@ class NetworkGenerator:
             network.add_edge(edge)
         
         # Create paths from definitions
-        for i, edge_sequence in enumerate(path_definitions):
-            path_id = f"P{i+1}"
-            path = NetworkPath(path_id, edge_sequence)
-            network.add_path(path)
+        network.add_paths_batch(path_definitions)
         
         return network
     
@@ -330,20 +340,39 @@ class NetworkGenerator:
                     edge_count += 1
         
         # Generate all possible paths through layers
-        self._generate_complete_paths(network, max_paths)
+        self._generate_complete_paths(network, max_paths, ('layered', tuple(layers)))
         
         return network
     
-    def _generate_complete_paths(self, network: NetworkState, max_paths: int):
-        """Generate all possible s-t paths (up to limit)"""
+    def _generate_complete_paths(self, network: NetworkState, max_paths: int,
+                                 topology: Optional[tuple] = None):
+        """
+        Generate all possible s-t paths (up to limit).
+        
+        Args:
+            network: Network to add the paths to
+            max_paths: Maximum paths to enumerate (None = no limit)
+            topology: Hashable description that fully determines the edge
+                structure; when given, the enumeration is shared between calls
+        """
         from path_enumerator import CompletePathEnumerator
         
+        key = (topology, max_paths)
+        paths = _PATH_CACHE.pop(key, None) if topology is not None else None
+        if paths is not None:
+            _PATH_CACHE[key] = paths  # Re-insert as most recently used
+            network.add_paths_batch([list(path) for path in paths])
+            print(f"   Complete enumeration: {len(paths)} paths (cached)")
+            return
+        
         enumerator = CompletePathEnumerator(network)
         result = enumerator.enumerate_all_paths(max_length=len(network.nodes) + 3, max_paths=max_paths)
+        if topology is not None:
+            _PATH_CACHE[key] = tuple(tuple(path) for path in result.paths)
+            if len(_PATH_CACHE) > _PATH_CACHE_SIZE:
+                del _PATH_CACHE[next(iter(_PATH_CACHE))]
         
-        for i, path_edges in enumerate(result.paths):
-            path = NetworkPath(f"P{i+1}", path_edges)
-            network.add_path(path)
+        network.add_paths_batch(result.paths)
         
         print(f"   Complete enumeration: {len(result.paths)} paths found in {result.enumeration_time:.3f}s")
     
@@ -385,7 +414,7 @@ def demo_network_generators():
         
         # Test flow setting on first path
         if network.paths:
-            path_id = list(network.paths.keys())[0]
+            path_id = network.path_ids[0]
             alternatives = controller.calculate_max_safe_flow(path_id)
             if not alternatives.get('error'):
                 max_safe = alternatives['max_safe_flow']
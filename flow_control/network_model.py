@@ -9,12 +9,16 @@ in the s-t flow control problem with random capacity variations.
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
 
 
 
 class NetworkNode:
     """Represents a node in the network graph"""
     
+    __slots__ = ('id', 'type', 'incoming_edges', 'outgoing_edges')
+    
     def __init__(self, node_id: str, node_type: str):
         """
         Initialize network node.
@@ -66,6 +70,9 @@ class NetworkNode:
 class NetworkEdge:
     """Represents an edge in the network graph with capacity and flow"""
     
+    __slots__ = ('id', 'from_node', 'to_node', '_network', '_index', '_capacity', '_flow',
+                 '_is_failed', 'base_capacity', 'original_capacity')
+    
     def __init__(self, edge_id: str, from_node: str, to_node: str, initial_capacity: float):
         """
         Initialize network edge.
@@ -79,12 +86,64 @@ class NetworkEdge:
         self.id = edge_id
         self.from_node = from_node
         self.to_node = to_node
-        self.capacity = max(0.0, initial_capacity)  # Current capacity c_e(t)
-        self.flow = 0.0  # Current flow f_e(t)
+        self._network = None  # Owning NetworkState once added (state lives in its arrays)
+        self._index = -1  # Slot in the network's edge arrays
+        self._capacity = max(0.0, initial_capacity)  # Current capacity c_e(t)
+        self._flow = 0.0  # Current flow f_e(t)
+        self._is_failed = False  # True if capacity = 0 due to failure
         self.base_capacity = initial_capacity  # Original capacity for recovery
-        self.is_failed = False  # True if capacity = 0 due to failure
-    
     
+    @property
+    def capacity(self) -> float:
+        """Current capacity (backed by network.edge_capacities when attached)"""
+        if self._network is None:
+            return self._capacity
+        return float(self._network.edge_capacities[self._index])
+    
+    @capacity.setter
+    def capacity(self, value: float):
+        if self._network is None:
+            self._capacity = value
+        else:
+            self._network.edge_capacities[self._index] = value
+            self._network._invalidate_bottlenecks(self.id)
+    
+    @property
+    def flow(self) -> float:
+        """Current flow (backed by network.edge_flows when attached)"""
+        if self._network is None:
+            return self._flow
+        return float(self._network.edge_flows[self._index])
+    
+    @flow.setter
+    def flow(self, value: float):
+        if self._network is None:
+            self._flow = value
+        else:
+            self._network.edge_flows[self._index] = value
+    
+    @property
+    def is_failed(self) -> bool:
+        """Failure flag (backed by network.edge_failed when attached)"""
+        if self._network is None:
+            return self._is_failed
+        return bool(self._network.edge_failed[self._index])
+    
+    @is_failed.setter
+    def is_failed(self, value: bool):
+        if self._network is None:
+            self._is_failed = value
+        else:
+            self._network.edge_failed[self._index] = value
+    
+    def _attach(self, network: 'NetworkState', index: int):
+        """Move capacity, flow and failure state into the owning network's edge arrays"""
+        capacity, flow, is_failed = self.capacity, self.flow, self.is_failed
+        self._network = network
+        self._index = index
+        network.edge_capacities[index] = capacity
+        network.edge_flows[index] = flow
+        network.edge_failed[index] = is_failed
     
     def get_utilization(self) -> float:
         """Get current utilization ratio (flow/capacity)"""
@@ -104,6 +163,9 @@ class NetworkEdge:
 class NetworkPath:
     """Represents a path from source to sink through the network"""
     
+    __slots__ = ('id', 'edges', '_network', '_index', '_flow', 'bottleneck_capacity',
+                 'bottleneck_edge', '_bottleneck_dirty')
+    
     def __init__(self, path_id: str, edge_sequence: List[str]):
         """
         Initialize network path.
@@ -114,9 +176,40 @@ class NetworkPath:
         """
         self.id = path_id
         self.edges = edge_sequence.copy()  # List of edge IDs in path order
-        self.current_flow = 0.0  # Current flow through this path
+        self._network = None  # Owning NetworkState once added (flow lives in its array)
+        self._index = -1  # Slot in network.path_flows
+        self._flow = 0.0  # Flow storage while detached from a network
         self.bottleneck_capacity = 0.0  # Minimum capacity along path
         self.bottleneck_edge = None  # Edge ID with minimum capacity
+        self._bottleneck_dirty = True  # Cleared once computed against the owning network
+    
+    @property
+    def current_flow(self) -> float:
+        """Current flow through this path (backed by network.path_flows when attached)"""
+        if self._network is None:
+            return self._flow
+        return float(self._network.path_flows[self._index])
+    
+    @current_flow.setter
+    def current_flow(self, value: float):
+        if self._network is None:
+            self._flow = value
+        else:
+            self._network.path_flows[self._index] = value
+    
+    def _attach(self, network: 'NetworkState', index: int):
+        """Move flow storage into the owning network's path_flows array"""
+        flow = self.current_flow
+        self._network = network
+        self._index = index
+        network.path_flows[index] = flow
+        self._bottleneck_dirty = True
+    
+    def _detach(self):
+        """Move flow storage back onto the path when it leaves its network"""
+        self._flow = self.current_flow
+        self._network = None
+        self._index = -1
     
     def calculate_bottleneck(self, edges: Dict) -> Tuple[float, Optional[str]]:
         """
@@ -131,18 +224,36 @@ class NetworkPath:
         if not self.edges:
             return 0.0, None
         
+        # Reuse the cached result until a capacity on this path changes
+        cacheable = self._network is not None and edges is self._network.edges
+        if cacheable and not self._bottleneck_dirty:
+            return self.bottleneck_capacity, self.bottleneck_edge
+        
         min_capacity = float('inf')
         bottleneck_edge = None
         
-        for edge_id in self.edges:
-            if edge_id in edges:
-                edge = edges[edge_id]
-                if edge.capacity < min_capacity:
-                    min_capacity = edge.capacity
-                    bottleneck_edge = edge_id
+        if cacheable and self._network.paths.get(self.id) is self:
+            # One reduction over this path's slice of the network's capacity array
+            network = self._network
+            offsets, slots = network._get_path_edge_index()
+            path_slots = slots[offsets[self._index]:offsets[self._index + 1]]
+            if len(path_slots):
+                capacities = network.edge_capacities[path_slots]
+                pos = int(capacities.argmin())
+                if capacities[pos] < min_capacity:
+                    min_capacity = float(capacities[pos])
+                    bottleneck_edge = network.edge_ids[path_slots[pos]]
+        else:
+            for edge_id in self.edges:
+                if edge_id in edges:
+                    edge = edges[edge_id]
+                    if edge.capacity < min_capacity:
+                        min_capacity = edge.capacity
+                        bottleneck_edge = edge_id
         
         self.bottleneck_capacity = min_capacity if min_capacity != float('inf') else 0.0
         self.bottleneck_edge = bottleneck_edge
+        self._bottleneck_dirty = not cacheable
         
         return self.bottleneck_capacity, self.bottleneck_edge
     
@@ -220,6 +331,33 @@ class NetworkState:
         self.paths: Dict[str, NetworkPath] = {}
         self.total_flow: float = 0.0
         
+        # Path flows in structure-of-arrays form: path_flows[i] is the flow of path_ids[i],
+        # and path_ids always equals list(paths) (change paths only via add_path/remove_path)
+        self.path_ids: List[str] = []
+        self._path_index: Dict[str, int] = {}
+        self._path_flow_buffer = np.zeros(8)
+        
+        # Edge state in the same form, indexed like edge_ids
+        self.edge_ids: List[str] = []
+        self.edge_list: List[NetworkEdge] = []
+        self._edge_index: Dict[str, int] = {}
+        self._edge_capacity_buffer = np.zeros(8)
+        self._edge_flow_buffer = np.zeros(8)
+        self._edge_failed_buffer = np.zeros(8, dtype=bool)
+        
+        # Node/edge incidence arrays for flow conservation, rebuilt after topology changes
+        self._conservation_index = None
+        
+        # Path -> edge-slot incidence in CSR form (offsets, slots), rebuilt after path/edge changes
+        self._path_edge_index = None
+        
+        # Reverse incidence: paths to re-check when an edge's capacity changes
+        self._edge_paths: Dict[str, List[NetworkPath]] = {}
+        
+        # Bumped on every topology or capacity change; keys cached max-flow solves
+        self._capacity_version = 0
+        self._topology_version = 0  # Bumped only when nodes or edges are added
+        
         # Network topology info
         self.source_node: Optional[str] = None
         self.sink_node: Optional[str] = None
@@ -229,6 +367,9 @@ class NetworkState:
     def add_node(self, node: NetworkNode):
         """Add a node to the network"""
         self.nodes[node.id] = node
+        self._conservation_index = None
+        self._capacity_version += 1
+        self._topology_version += 1
         
         if node.type == 'source':
             self.source_node = node.id
@@ -239,16 +380,178 @@ class NetworkState:
         """Add an edge to the network and update node connections"""
         self.edges[edge.id] = edge
         
+        # Reuse the slot of a previously added edge with the same ID
+        index = self._edge_index.get(edge.id)
+        if index is None:
+            index = len(self.edge_ids)
+            if index == len(self._edge_flow_buffer):
+                self._edge_capacity_buffer = np.resize(self._edge_capacity_buffer, 2 * index)
+                self._edge_flow_buffer = np.resize(self._edge_flow_buffer, 2 * index)
+                self._edge_failed_buffer = np.resize(self._edge_failed_buffer, 2 * index)
+            self._edge_index[edge.id] = index
+            self.edge_ids.append(edge.id)
+            self.edge_list.append(edge)
+        else:
+            self.edge_list[index] = edge
+        edge._attach(self, index)
+        self._invalidate_bottlenecks(edge.id)
+        self._conservation_index = None
+        self._path_edge_index = None
+        self._topology_version += 1
+        
         # Update node connections
         if edge.from_node in self.nodes:
             self.nodes[edge.from_node].add_outgoing_edge(edge.id)
         if edge.to_node in self.nodes:
             self.nodes[edge.to_node].add_incoming_edge(edge.id)
     
+    @property
+    def edge_capacities(self) -> np.ndarray:
+        """Capacities of all edges, indexed like edge_ids"""
+        return self._edge_capacity_buffer[:len(self.edge_ids)]
+    
+    @property
+    def edge_flows(self) -> np.ndarray:
+        """Flows of all edges, indexed like edge_ids"""
+        return self._edge_flow_buffer[:len(self.edge_ids)]
+    
+    @property
+    def edge_failed(self) -> np.ndarray:
+        """Failure flags of all edges, indexed like edge_ids"""
+        return self._edge_failed_buffer[:len(self.edge_ids)]
+    
+    @property
+    def path_flows(self) -> np.ndarray:
+        """Flows of all paths, indexed like path_ids"""
+        return self._path_flow_buffer[:len(self.path_ids)]
+    
     def add_path(self, path: NetworkPath):
         """Add a path to the network"""
+        # Reuse the slot of a previously added path with the same ID
+        index = self._path_index.get(path.id)
+        if index is not None:
+            replaced = self.paths[path.id]
+            if replaced is not path:
+                replaced._detach()
+            self._unlink_path_edges(replaced)
+        else:
+            index = len(self.path_ids)
+            if index == len(self._path_flow_buffer):
+                self._path_flow_buffer = np.resize(self._path_flow_buffer, 2 * index)
+            self._path_index[path.id] = index
+            self.path_ids.append(path.id)
         self.paths[path.id] = path
+        path._attach(self, index)
+        self._path_edge_index = None
+        for edge_id in path.edges:
+            self._edge_paths.setdefault(edge_id, []).append(path)
     
+    def remove_path(self, path_id: str) -> NetworkPath:
+        """
+        Remove a path from the network, keeping path_ids in step with paths.
+        
+        Later paths move down one slot in path_flows. The removed path is
+        detached and keeps its last flow.
+        
+        Returns:
+            The removed path
+        """
+        path = self.paths.pop(path_id)
+        index = self._path_index.pop(path_id)
+        flows = self.path_flows
+        path._detach()
+        flows[index:-1] = flows[index + 1:]
+        del self.path_ids[index]
+        for pos in range(index, len(self.path_ids)):
+            moved_id = self.path_ids[pos]
+            self._path_index[moved_id] = pos
+            self.paths[moved_id]._index = pos
+        
+        self._unlink_path_edges(path)
+        self._path_edge_index = None
+        return path
+    
+    def clear_paths(self):
+        """Remove every path from the network, detaching each one with its last flow"""
+        for path in self.paths.values():
+            path._detach()
+        self.paths.clear()
+        self.path_ids.clear()
+        self._path_index.clear()
+        self._edge_paths.clear()
+        self._path_edge_index = None
+    
+    def _unlink_path_edges(self, path: NetworkPath):
+        """Drop a path from the edge -> paths reverse index"""
+        for edge_id in path.edges:
+            users = self._edge_paths.get(edge_id)
+            if users is not None:
+                users[:] = [p for p in users if p is not path]
+    
+    def add_paths_batch(self, edge_sequences: List[List[str]], prefix: str = "P") -> List[str]:
+        """
+        Append one path per edge sequence, numbered after the existing paths.
+        
+        On a network with k paths the new IDs are prefix + str(k + 1),
+        prefix + str(k + 2), ... Existing paths are never replaced: if a
+        generated ID is already taken, ValueError is raised and nothing is added.
+        The path arrays are grown and filled once for the whole batch.
+        
+        Returns:
+            IDs of the added paths, in the order of edge_sequences
+        """
+        start = len(self.path_ids)
+        path_ids = [f"{prefix}{start + i}" for i in range(1, len(edge_sequences) + 1)]
+        taken = [path_id for path_id in path_ids if path_id in self._path_index]
+        if taken:
+            raise ValueError(f"Path IDs already in use: {', '.join(taken)}")
+        
+        needed = start + len(path_ids)
+        if needed > len(self._path_flow_buffer):
+            self._path_flow_buffer = np.resize(self._path_flow_buffer, needed)
+        self._path_flow_buffer[start:needed] = 0.0
+        self.path_ids.extend(path_ids)
+        
+        for index, (path_id, edge_sequence) in enumerate(zip(path_ids, edge_sequences), start):
+            path = NetworkPath(path_id, edge_sequence)
+            self.paths[path_id] = path
+            self._path_index[path_id] = index
+            path._network = self
+            path._index = index
+            for edge_id in path.edges:
+                self._edge_paths.setdefault(edge_id, []).append(path)
+        
+        self._path_edge_index = None
+        return path_ids
+    
+    def _invalidate_bottlenecks(self, edge_id: str):
+        """Mark the cached bottleneck of every path using an edge as stale"""
+        self._capacity_version += 1
+        for path in self._edge_paths.get(edge_id, ()):
+            path._bottleneck_dirty = True
+    
+    
+    def is_solvable(self) -> bool:
+        """Check whether some s-t route has positive capacity on every edge (max flow > 0)"""
+        if not self.source_node or not self.sink_node:
+            return False
+        
+        reached = {self.source_node}
+        frontier = [self.source_node]
+        while frontier:
+            node = self.nodes.get(frontier.pop())
+            if node is None:
+                continue
+            for edge_id in node.outgoing_edges:
+                edge = self.edges.get(edge_id)
+                if edge is None or edge.capacity <= 0 or edge.to_node in reached:
+                    continue
+                if edge.to_node == self.sink_node:
+                    return True
+                reached.add(edge.to_node)
+                frontier.append(edge.to_node)
+        
+        return False
     
     def calculate_total_throughput(self) -> float:
         """Calculate total throughput (flow into sink node)"""
@@ -256,8 +559,9 @@ class NetworkState:
             return 0.0
         
         sink = self.nodes[self.sink_node]
-        total = sum(self.edges[eid].flow for eid in sink.incoming_edges 
-                   if eid in self.edges)
+        sink_edges = [self._edge_index[eid] for eid in sink.incoming_edges
+                      if eid in self._edge_index]
+        total = float(self.edge_flows[sink_edges].sum())
         
         self.total_flow = total
         return total
@@ -269,14 +573,53 @@ class NetworkState:
         Returns:
             List of (node_id, imbalance) for nodes violating conservation
         """
-        violations = []
-        
-        for node in self.nodes.values():
-            is_conserved, imbalance = node.validate_flow_conservation(self.edges)
-            if not is_conserved:
-                violations.append((node.id, imbalance))
-        
-        return violations
+        if self._conservation_index is None:
+            self._conservation_index = self._build_conservation_index()
+        node_ids, in_pos, in_edges, out_pos, out_edges = self._conservation_index
+        
+        # Net flow per intermediate node in one pass over the edge flow array
+        flows = self.edge_flows
+        inflow = np.bincount(in_pos, weights=flows[in_edges], minlength=len(node_ids))
+        outflow = np.bincount(out_pos, weights=flows[out_edges], minlength=len(node_ids))
+        imbalance = np.abs(inflow - outflow)
+        
+        # Same tolerance as NetworkNode.validate_flow_conservation
+        return [(node_ids[i], float(imbalance[i])) for i in np.flatnonzero(imbalance >= 1e-6)]
+    
+    def _build_conservation_index(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Flatten intermediate-node edge incidences into (node position, edge slot) arrays"""
+        node_ids = [nid for nid, node in self.nodes.items() if node.type == 'intermediate']
+        in_pos, in_edges, out_pos, out_edges = [], [], [], []
+        
+        for pos, node_id in enumerate(node_ids):
+            node = self.nodes[node_id]
+            for edge_id in node.incoming_edges:
+                in_pos.append(pos)
+                in_edges.append(self._edge_index[edge_id])
+            for edge_id in node.outgoing_edges:
+                out_pos.append(pos)
+                out_edges.append(self._edge_index[edge_id])
+        
+        return (node_ids, np.array(in_pos, dtype=np.intp), np.array(in_edges, dtype=np.intp),
+                np.array(out_pos, dtype=np.intp), np.array(out_edges, dtype=np.intp))
+    
+    def _get_path_edge_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the CSR path -> edge-slot index, rebuilding it after topology changes"""
+        if self._path_edge_index is None:
+            self._path_edge_index = self._build_path_edge_index()
+        return self._path_edge_index
+    
+    def _build_path_edge_index(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Flatten path edge sequences into CSR arrays over edge slots, indexed like path_ids"""
+        offsets = np.zeros(len(self.path_ids) + 1, dtype=np.intp)
+        slots = []
+        
+        for pos, path_id in enumerate(self.path_ids):
+            slots.extend(self._edge_index[eid] for eid in self.paths[path_id].edges
+                         if eid in self._edge_index)
+            offsets[pos + 1] = len(slots)
+        
+        return offsets, np.array(slots, dtype=np.intp)
     
     def get_system_snapshot(self) -> Dict:
         """
@@ -11,12 +11,47 @@ import matplotlib.patches as mpatches
 import matplotlib.ticker as ticker
 import networkx as nx
 import numpy as np
+import io
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import partial
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
 from network_model import NetworkState, NetworkNode, NetworkEdge
 
 
+# Snapshot files are encoded on the caller's thread (Agg is not thread-safe)
+# and written to disk in the background, overlapping I/O with the next render
+_writer_pool = ThreadPoolExecutor(max_workers=4)
+_pending_writes: List[Future] = []
+
+
+# Node positions keyed by topology, so visualizers over identical networks
+# (e.g. the states of a comparison view) compute the layout only once.
+# Least recently used layouts are evicted past _LAYOUT_CACHE_SIZE.
+_LAYOUT_CACHE_SIZE = 32
+_LAYOUT_CACHE: Dict[tuple, Dict] = {}
+
+
+def _finish_snapshot_write(filename: str, future: Future):
+    """Report a finished snapshot write and drop it from the pending list"""
+    try:
+        _pending_writes.remove(future)
+    except ValueError:
+        pass  # Already taken by flush_snapshot_writes
+    error = future.exception()
+    if error is not None:
+        print(f"❌ Failed to save visualization to {filename}: {error}")
+    else:
+        print(f"Visualization saved to {filename}")
+
+
+def flush_snapshot_writes():
+    """Block until every queued snapshot file has been written (failures are reported as they finish)"""
+    wait(list(_pending_writes))
+
+
 @dataclass
 class VisualizationConfig:
     """Configuration for network visualization"""
@@ -26,6 +61,7 @@ class VisualizationConfig:
     alert_highlight_width: float = 4.0
     update_interval: float = 1.0  # seconds
     max_history_points: int = 100
+    snapshot_dpi: int = 300
     
     # Colors
     source_color: str = '#2E8B57'  # Sea Green
@@ -56,6 +92,9 @@ class NetworkVisualizer:
         self.graph = None
         self.pos = None
         
+        # Persistent topology artists, restyled in place on each update
+        self._topology_artists = None
+        
         # Performance tracking removed - static network only
         
         # Current network state
@@ -88,6 +127,7 @@ class NetworkVisualizer:
         
         # Create NetworkX graph for layout
         self._build_networkx_graph(network)
+        self._topology_artists = None
         
         plt.tight_layout(rect=[0, 0, 1, 0.95])  # Leave space for legend at the top
         return self.fig, self.axes
@@ -105,8 +145,18 @@ class NetworkVisualizer:
             self.graph.add_edge(edge.from_node, edge.to_node, 
                               edge_id=edge_id, edge_obj=edge)
         
-        # Calculate layout positions optimized for s-t networks
-        self.pos = self._calculate_optimized_layout(network)
+        # Calculate layout positions optimized for s-t networks, reusing the
+        # cached layout for a topology seen before
+        key = (tuple((node_id, node.type) for node_id, node in network.nodes.items()),
+               tuple(self.graph.edges),
+               network.source_node, network.sink_node)
+        layout = _LAYOUT_CACHE.pop(key, None)
+        if layout is None:
+            layout = self._calculate_optimized_layout(network)
+            if len(_LAYOUT_CACHE) >= _LAYOUT_CACHE_SIZE:
+                del _LAYOUT_CACHE[next(iter(_LAYOUT_CACHE))]
+        _LAYOUT_CACHE[key] = layout  # Re-insert as most recently used
+        self.pos = dict(layout)
     
     def _calculate_optimized_layout(self, network: NetworkState) -> Dict:
         """
@@ -193,9 +243,11 @@ class NetworkVisualizer:
         """
         self.current_network = network
         
-        # Clear all axes
+        # Clear the panels whose content is redrawn; the topology panel keeps
+        # its artists and only restyles them
         for ax in self.axes.flat:
-            ax.clear()
+            if ax is not self.axes[0,0] or self._topology_artists is None:
+                ax.clear()
         
         # Update each subplot
         self._draw_network_topology(network)
@@ -203,18 +255,58 @@ class NetworkVisualizer:
         self._draw_flow_distribution(network)
         self._draw_alert_dashboard(network)
         
-        self.fig.canvas.draw()
+        # savefig renders the figure itself; only live windows need an explicit draw
+        if self.interactive_mode:
+            self.fig.canvas.draw()
     
     def _draw_network_topology(self, network: NetworkState):
         """Draw the network topology with current state"""
         ax = self.axes[0,0]
-        ax.set_title('Network Topology')
         
         if not self.graph or not self.pos:
+            ax.set_title('Network Topology')
             ax.text(0.5, 0.5, 'No network topology available', 
                    ha='center', va='center', transform=ax.transAxes)
             return
         
+        if self._topology_artists is None:
+            self._create_topology_artists(network)
+        
+        edge_patches, edge_label_texts = self._topology_artists
+        
+        # Restyle each edge by state and refresh its label
+        for (u, v, edge_id) in self.graph.edges(data='edge_id'):
+            edge_obj = network.edges.get(edge_id)
+            if not edge_obj:
+                continue
+            
+            patch = edge_patches[(u, v)]
+            if edge_obj.is_failed or edge_obj.capacity == 0:
+                patch.set_color(self.config.failed_edge_color)
+                patch.set_linewidth(self.config.alert_highlight_width)
+                patch.set_linestyle('dashed')
+                patch.set_alpha(0.9)
+            elif edge_obj.overload_alert or edge_obj.flow > edge_obj.capacity:
+                patch.set_color(self.config.overload_edge_color)
+                patch.set_linewidth(self.config.alert_highlight_width)
+                patch.set_linestyle('solid')
+                patch.set_alpha(0.9)
+            else:
+                patch.set_color(self.config.normal_edge_color)
+                patch.set_linewidth(2)
+                patch.set_linestyle('solid')
+                patch.set_alpha(0.7)
+            
+            if (u, v) in edge_label_texts:
+                edge_label_texts[(u, v)].set_text(
+                    f'{edge_id}\nc={edge_obj.capacity:.1f}\nf={edge_obj.flow:.1f}')
+    
+    def _create_topology_artists(self, network: NetworkState):
+        """Draw the static topology once and keep handles to per-edge artists"""
+        ax = self.axes[0,0]
+        ax.clear()
+        ax.set_title('Network Topology')
+        
         # Draw nodes
         node_colors = []
         for node_id in self.graph.nodes():
@@ -234,58 +326,23 @@ class NetworkVisualizer:
                               node_size=self.config.node_size,
                               alpha=0.8)
         
-        # Draw edges with different styles based on state
-        normal_edges = []
-        overload_edges = []
-        failed_edges = []
-        
-        edge_labels = {}
-        
-        for (u, v, data) in self.graph.edges(data=True):
-            edge_obj = data.get('edge_obj')
-            edge_id = data.get('edge_id')
-            
-            if edge_obj:
-                # Create edge label with capacity and flow
-                label = f'{edge_id}\nc={edge_obj.capacity:.1f}\nf={edge_obj.flow:.1f}'
-                edge_labels[(u, v)] = label
-                
-                # Categorize edge by state
-                if edge_obj.is_failed or edge_obj.capacity == 0:
-                    failed_edges.append((u, v))
-                elif edge_obj.overload_alert or edge_obj.flow > edge_obj.capacity:
-                    overload_edges.append((u, v))
-                else:
-                    normal_edges.append((u, v))
-        
-        # Draw edges by category
-        if normal_edges:
-            nx.draw_networkx_edges(self.graph, self.pos, ax=ax,
-                                  edgelist=normal_edges,
-                                  edge_color=self.config.normal_edge_color,
-                                  width=2, alpha=0.7)
-        
-        if overload_edges:
-            nx.draw_networkx_edges(self.graph, self.pos, ax=ax,
-                                  edgelist=overload_edges,
-                                  edge_color=self.config.overload_edge_color,
-                                  width=self.config.alert_highlight_width, alpha=0.9)
-        
-        if failed_edges:
-            nx.draw_networkx_edges(self.graph, self.pos, ax=ax,
-                                  edgelist=failed_edges,
-                                  edge_color=self.config.failed_edge_color,
-                                  width=self.config.alert_highlight_width, 
-                                  style='dashed', alpha=0.9)
+        # One artist per edge so its style can change without redrawing the axis
+        edge_patches = {}
+        for (u, v) in self.graph.edges():
+            edge_patches[(u, v)] = nx.draw_networkx_edges(self.graph, self.pos, ax=ax,
+                                                         edgelist=[(u, v)],
+                                                         edge_color=self.config.normal_edge_color,
+                                                         width=2, alpha=0.7)[0]
         
         # Draw labels
         nx.draw_networkx_labels(self.graph, self.pos, ax=ax, 
                                font_size=10, font_weight='bold')
         
-        # Draw edge labels
-        nx.draw_networkx_edge_labels(self.graph, self.pos, edge_labels, ax=ax,
-                                    font_size=7, bbox=dict(boxstyle='round,pad=0.1',
-                                                          facecolor='white', alpha=0.9))
+        # Draw edge labels (text is filled in on every update)
+        edge_labels = {(u, v): edge_id for (u, v, edge_id) in self.graph.edges(data='edge_id')}
+        edge_label_texts = nx.draw_networkx_edge_labels(self.graph, self.pos, edge_labels, ax=ax,
+                                                       font_size=7, bbox=dict(boxstyle='round,pad=0.1',
+                                                                             facecolor='white', alpha=0.9))
         
         ax.set_aspect('equal')
         ax.axis('off')
@@ -301,6 +358,8 @@ class NetworkVisualizer:
         ]
         ax.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, 1.15), 
                  ncol=3, fontsize=8, frameon=True, fancybox=True, shadow=True)
+        
+        self._topology_artists = (edge_patches, edge_label_texts)
     
     def _draw_performance_metrics(self, network: NetworkState):
         """Draw current performance metrics (static view)"""
@@ -457,9 +516,13 @@ Violations: {len(conservation_violations)} | Overloads: {overload_count} | Failu
     def save_snapshot(self, filename: str):
         """Save current visualization as image"""
         if self.fig:
-            self.fig.savefig(filename, dpi=300, bbox_inches='tight', 
+            buffer = io.BytesIO()
+            self.fig.savefig(buffer, format=Path(filename).suffix[1:] or 'png',
+                           dpi=self.config.snapshot_dpi, bbox_inches='tight', 
                            facecolor='white', edgecolor='none')
-            print(f"Visualization saved to {filename}")
+            future = _writer_pool.submit(Path(filename).write_bytes, buffer.getvalue())
+            _pending_writes.append(future)
+            future.add_done_callback(partial(_finish_snapshot_write, filename))
     
     def start_interactive_mode(self, network: NetworkState, update_callback=None):
         """
@@ -534,6 +597,8 @@ class NetworkGraphVisualizer:
         """Initialize graph visualizer"""
         self.network = network
         self.nx_graph = None
+        self._planar_base_pos = None  # Shared starting layout of the planar strategies
+        self._planarity = None  # (is_planar, embedding) from nx.check_planarity
         self._build_nx_graph()
         
         # Color scheme
@@ -562,6 +627,8 @@ class NetworkGraphVisualizer:
                       is_failed=edge.is_failed)
         
         self.nx_graph = G
+        self._planar_base_pos = None
+        self._planarity = None
         return G
     
     def _determine_layout(self, layout: str = "auto") -> Dict[str, Tuple[float, float]]:
@@ -660,18 +727,43 @@ class NetworkGraphVisualizer:
         # Fallback to spring layout
         return nx.spring_layout(self.nx_graph, seed=42)
     
+    def _check_planarity(self) -> Tuple[bool, Optional[nx.PlanarEmbedding]]:
+        """Planarity test and embedding of the graph, computed once per graph"""
+        if self._planarity is None:
+            self._planarity = nx.check_planarity(self.nx_graph)
+        return self._planarity
+    
+    @property
+    def is_planar(self) -> bool:
+        """Whether the network graph is planar"""
+        return self._check_planarity()[0]
+    
+    @property
+    def embedding(self) -> Optional[nx.PlanarEmbedding]:
+        """Planar embedding of the network graph, or None if it is not planar"""
+        is_planar, embedding = self._check_planarity()
+        return embedding if is_planar else None
+    
+    def _planar_base_layout(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Planar embedding if the graph is planar, else Kamada-Kawai.
+        
+        Computed once per graph; callers get their own copy to adjust.
+        """
+        if self._planar_base_pos is None:
+            if self.is_planar:
+                # Lay out the cached embedding instead of testing planarity again
+                self._planar_base_pos = nx.planar_layout(self.embedding)
+            else:
+                # Kamada-Kawai minimizes edge crossings for non-planar graphs
+                self._planar_base_pos = nx.kamada_kawai_layout(self.nx_graph)
+        return dict(self._planar_base_pos)
+    
     def _create_planar_layout(self) -> Dict[str, Tuple[float, float]]:
         """Create planar layout minimizing edge crossings"""
         try:
-            # Try NetworkX planar layout if graph is planar
-            if nx.is_planar(self.nx_graph):
-                pos = nx.planar_layout(self.nx_graph)
-                # Ensure s is on left, t is on right
-                return self._adjust_for_st_placement(pos)
-            else:
-                # Use Kamada-Kawai for non-planar graphs (minimizes edge crossings)
-                pos = nx.kamada_kawai_layout(self.nx_graph)
-                return self._adjust_for_st_placement(pos)
+            # Ensure s is on left, t is on right
+            return self._adjust_for_st_placement(self._planar_base_layout())
         except:
             # Fallback to spring layout
             pos = nx.spring_layout(self.nx_graph, k=3, iterations=100, seed=42)
@@ -681,12 +773,8 @@ class NetworkGraphVisualizer:
         """Create s-t optimized planar layout with minimal crossings"""
         # Start with the best available layout for crossing minimization
         try:
-            # First try: Check if graph is planar
-            if nx.is_planar(self.nx_graph):
-                pos = nx.planar_layout(self.nx_graph)
-            else:
-                # Use Kamada-Kawai (good for minimizing crossings)
-                pos = nx.kamada_kawai_layout(self.nx_graph)
+            # Planar embedding, or Kamada-Kawai for non-planar graphs
+            pos = self._planar_base_layout()
         except:
             # Fallback: Spring layout with more iterations
             pos = nx.spring_layout(self.nx_graph, k=3, iterations=200, seed=42)
@@ -1021,7 +1109,7 @@ def demonstrate_graph_visualization():
         # Set some flows for demonstration
         controller = FlowController(network)
         if network.paths:
-            path_ids = list(network.paths.keys())[:2]
+            path_ids = network.path_ids[:2]
             for path_id in path_ids:
                 alternatives = controller.calculate_max_safe_flow(path_id)
                 if not alternatives.get('error'):
@@ -1030,7 +1118,7 @@ def demonstrate_graph_visualization():
                         controller.set_path_flow_with_alternatives(path_id, max_safe * 0.7)
         
         # Display with path highlighting
-        highlight_paths = list(network.paths.keys())[:2] if network.paths else None
+        highlight_paths = network.path_ids[:2] if network.paths else None
         print(f"   Highlighting paths: {highlight_paths}")
         
         # For demonstration, create the visualizer
@@ -7,12 +7,15 @@ Allows users to choose between theoretical completeness and practical efficiency
 """
 
 import time
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, Iterator, List, Set, Tuple, Optional
 from dataclasses import dataclass
+
+import numpy as np
+
 from network_model import NetworkState, NetworkNode, NetworkEdge, NetworkPath
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PathEnumerationResult:
     """Results from path enumeration"""
     paths: List[List[str]]  # List of edge sequences
@@ -23,26 +26,127 @@ class PathEnumerationResult:
     max_paths_limit: Optional[int] = None
 
 
+def capacity_reachable_nodes(network: NetworkState) -> Set[str]:
+    """
+    Find the nodes that can still reach the sink through edges with capacity > 0.
+    
+    Walks the reversed graph from the sink. The sink itself is included.
+    """
+    if not network.sink_node:
+        return set()
+    
+    reverse_adj: Dict[str, List[str]] = {}
+    capacities = network.edge_capacities.tolist()
+    for edge, capacity in zip(network.edge_list, capacities):
+        if capacity > 0:
+            reverse_adj.setdefault(edge.to_node, []).append(edge.from_node)
+    
+    reachable = {network.sink_node}
+    stack = [network.sink_node]
+    while stack:
+        for prev_node in reverse_adj.get(stack.pop(), ()):
+            if prev_node not in reachable:
+                reachable.add(prev_node)
+                stack.append(prev_node)
+    
+    return reachable
+
+
 class CompletePathEnumerator:
     """Complete enumeration of all s-t paths in a network"""
     
-    def __init__(self, network: NetworkState):
-        """Initialize path enumerator"""
+    def __init__(self, network: NetworkState, reachable: Optional[Set[str]] = None):
+        """
+        Initialize path enumerator.
+        
+        Args:
+            network: Network to enumerate paths in
+            reachable: Optional set of nodes allowed on a path, e.g. from
+                capacity_reachable_nodes(); the search never enters any other node
+        """
         self.network = network
         self.source = network.source_node
         self.sink = network.sink_node
-        self.adjacency = self._build_adjacency_list()
+        self.reachable = reachable
+        self._build_adjacency_arrays()
     
-    def _build_adjacency_list(self) -> Dict[str, List[Tuple[str, str]]]:
-        """Build adjacency list: node_id -> [(next_node, edge_id), ...]"""
-        adj = {}
-        for node_id in self.network.nodes:
-            adj[node_id] = []
+    def _build_adjacency_arrays(self):
+        """Build CSR adjacency over node indices, keeping each node's edges in insertion order"""
+        node_ids = list(self.network.nodes)
+        node_index = {node_id: i for i, node_id in enumerate(node_ids)}
+        edge_list = self.network.edge_list
+        for edge in edge_list:
+            if edge.to_node not in node_index:
+                node_index[edge.to_node] = len(node_ids)
+                node_ids.append(edge.to_node)
         
-        for edge_id, edge in self.network.edges.items():
-            adj[edge.from_node].append((edge.to_node, edge_id))
+        edge_ids = self.network.edge_ids
+        tails = np.array([node_index[edge.from_node] for edge in edge_list], dtype=np.intp)
+        heads = np.array([node_index[edge.to_node] for edge in edge_list], dtype=np.intp)
+        if self.reachable is not None:
+            # Drop edges into nodes that can't reach the sink so the search never branches there
+            allowed = np.array([node_id in self.reachable for node_id in node_ids], dtype=bool)
+            keep = np.flatnonzero(allowed[heads])
+            edge_ids = [edge_ids[i] for i in keep]
+            tails, heads = tails[keep], heads[keep]
+        order = np.argsort(tails, kind='stable')
         
-        return adj
+        offsets = np.zeros(len(node_ids) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(tails, minlength=len(node_ids)), out=offsets[1:])
+        
+        # Per-node (next node, edge ID) lists sliced from the CSR arrays for the search loop
+        heads = heads[order].tolist()
+        edges = [edge_ids[i] for i in order]
+        bounds = offsets.tolist()
+        self._node_index = node_index
+        self._adj_lists = [list(zip(heads[lo:hi], edges[lo:hi]))
+                           for lo, hi in zip(bounds[:-1], bounds[1:])]
+    
+    def _iter_paths(self, max_length: Optional[int] = None) -> Iterator[List[str]]:
+        """
+        Yield simple s-t paths as edge sequences in depth-first order.
+        
+        Uses an explicit stack of neighbor iterators instead of recursion.
+        As before, a path is cut off once it reaches max_length edges, even
+        if it would end at the sink.
+        """
+        adj = self._adj_lists
+        source = self._node_index[self.source]
+        sink = self._node_index.get(self.sink)
+        
+        if source == sink:
+            yield []
+            return
+        
+        visited = [False] * len(adj)
+        visited[source] = True
+        nodes = [source]
+        stack = [iter(adj[source])]
+        path: List[str] = []
+        
+        while stack:
+            if max_length and len(path) + 1 >= max_length:
+                neighbors = ()  # Don't extend this path
+            else:
+                neighbors = stack[-1]
+            
+            for next_node, edge_id in neighbors:
+                if visited[next_node]:
+                    continue  # Ensure simple paths
+                if next_node == sink:
+                    yield path + [edge_id]
+                    continue
+                visited[next_node] = True
+                nodes.append(next_node)
+                stack.append(iter(adj[next_node]))
+                path.append(edge_id)
+                break
+            else:
+                # Backtrack
+                visited[nodes.pop()] = False
+                stack.pop()
+                if path:
+                    path.pop()
     
     def enumerate_all_paths(self, 
                            max_length: Optional[int] = None,
@@ -63,40 +167,10 @@ class CompletePathEnumerator:
         start_time = time.time()
         all_paths = []
         
-        def dfs(current_node: str, current_path: List[str], visited: Set[str]):
-            # Check limits
+        for path in self._iter_paths(max_length):
+            all_paths.append(path)
             if max_paths and len(all_paths) >= max_paths:
-                return False  # Stop search
-            
-            if max_length and len(current_path) >= max_length:
-                return True  # Continue search but don't extend this path
-            
-            # Found target
-            if current_node == self.sink:
-                all_paths.append(current_path.copy())
-                return True
-            
-            # Explore neighbors
-            if current_node in self.adjacency:
-                for next_node, edge_id in self.adjacency[current_node]:
-                    if next_node not in visited:  # Ensure simple paths
-                        visited.add(next_node)
-                        current_path.append(edge_id)
-                        
-                        continue_search = dfs(next_node, current_path, visited)
-                        
-                        # Backtrack
-                        current_path.pop()
-                        visited.remove(next_node)
-                        
-                        if not continue_search:
-                            return False  # Early termination
-            
-            return True
-        
-        # Start DFS from source
-        visited = {self.source}
-        dfs(self.source, [], visited)
+                break  # Early termination
         
         end_time = time.time()
         is_complete = not (max_paths and len(all_paths) >= max_paths)
@@ -119,38 +193,19 @@ class CompletePathEnumerator:
             return 0
         
         count = 0
+        for _ in self._iter_paths(max_length):
+            count += 1
         
-        def dfs(current_node: str, path_length: int, visited: Set[str]) -> int:
-            nonlocal count
-            
-            if max_length and path_length >= max_length:
-                return count
-            
-            if current_node == self.sink:
-                count += 1
-                return count
-            
-            if current_node in self.adjacency:
-                for next_node, _ in self.adjacency[current_node]:
-                    if next_node not in visited:
-                        visited.add(next_node)
-                        dfs(next_node, path_length + 1, visited)
-                        visited.remove(next_node)
-            
-            return count
-        
-        visited = {self.source}
-        dfs(self.source, 0, visited)
         return count
 
 
 class SmartPathSelector:
     """Complete path enumeration with safety limits"""
     
-    def __init__(self, network: NetworkState):
+    def __init__(self, network: NetworkState, reachable: Optional[Set[str]] = None):
         """Initialize path selector for complete enumeration"""
         self.network = network
-        self.enumerator = CompletePathEnumerator(network)
+        self.enumerator = CompletePathEnumerator(network, reachable)
     
     def estimate_complexity(self) -> Tuple[int, int]:
         """
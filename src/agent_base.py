@@ -23,7 +23,8 @@ class BaseAgent:
         logger: Logger instance for this agent
     """
     
-    def __init__(self, agent_id: str, model: str = None, reasoning_effort: str = "low", verbosity: str = "low"):
+    def __init__(self, agent_id: str, model: str = None, reasoning_effort: str = "low", verbosity: str = "low",
+                 http_client=None):
         """Initialize the agent
         
         Args:
@@ -31,10 +32,12 @@ class BaseAgent:
             model: LLM model to use (optional, uses default if not specified)
             reasoning_effort: Reasoning level - "low", "medium", "high" (default: "low")
             verbosity: Response verbosity - "low", "medium", "high" (default: "low")
+            http_client: Shared httpx.Client passed to the NLM session (optional)
         """
         self.agent_id = agent_id
         self.session = NLMSession(namespace=agent_id, model=model, 
-                                 reasoning_effort=reasoning_effort, verbosity=verbosity)
+                                 reasoning_effort=reasoning_effort, verbosity=verbosity,
+                                 http_client=http_client)
         self.running = False
         self.logger = logging.getLogger(f"Agent.{agent_id}")
         
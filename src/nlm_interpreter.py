@@ -25,7 +25,7 @@ class NLMSession:
     AT_PREFIX = "@"
     
     def __init__(self, namespace=None, model=None, endpoint=None, api_key=None, 
-                 reasoning_effort="low", verbosity="low"):
+                 reasoning_effort="low", verbosity="low", http_client=None):
         """Initialize NLM session
         
         Args:
@@ -35,6 +35,7 @@ class NLMSession:
             api_key: API key (auto-loaded for OpenAI models)
             reasoning_effort: Reasoning level - "low", "medium", "high" (default: "low")
             verbosity: Response verbosity - "low", "medium", "high" (default: "low")
+            http_client: Shared httpx.Client for connection reuse across sessions (optional)
         """
         self.namespace = namespace or str(uuid.uuid4())[:8]
         
@@ -51,6 +52,9 @@ class NLMSession:
         self.reasoning_effort = reasoning_effort
         self.verbosity = verbosity
         
+        # Optional shared HTTP connection pool (None = client-owned pool)
+        self.http_client = http_client
+        
         if self.model in openai_models:
             # OpenAI API configuration
             self.endpoint = endpoint or "https://api.openai.com/v1"
@@ -61,10 +65,7 @@ class NLMSession:
             self.api_key = api_key or "ollama"
         
         # Initialize OpenAI client
-        self.client = OpenAI(
-            base_url=self.endpoint,
-            api_key=self.api_key
-        )
+        self.client = self._create_client()
         
         # Initialize variable management
         self.variable_db = VariableDB("variables.db")
@@ -424,6 +425,17 @@ Available tools: save_variable, get_variable, list_variables, delete_variable, d
         except Exception as e:
             return f"Error executing tool {function_name}: {str(e)}"
 
+    def _create_client(self):
+        """Create OpenAI client for the current endpoint, reusing the shared HTTP pool if set
+        
+        Returns:
+            OpenAI: Configured API client
+        """
+        if self.http_client is None:
+            return OpenAI(base_url=self.endpoint, api_key=self.api_key)
+        return OpenAI(base_url=self.endpoint, api_key=self.api_key,
+                      http_client=self.http_client)
+
     def _save_current_state(self):
         """Save current session state for temporary override scenarios
         
@@ -487,10 +499,7 @@ Available tools: save_variable, get_variable, list_variables, delete_variable, d
                 self.api_key = "ollama"
             
             # Create new client with updated configuration
-            self.client = OpenAI(
-                base_url=self.endpoint,
-                api_key=self.api_key
-            )
+            self.client = self._create_client()
         except Exception as e:
             # Re-raise with more context
             raise ValueError(f"Failed to configure model '{temp_model}': {str(e)}")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Test that the FlowController batch methods match their per-path counterparts"""
+
+import numpy as np
+import pytest
+
+from flow_operations import FlowController
+from network_model import create_simple_network
+
+
+def make_controller():
+    """Simple network plus P3, which shares e1/e2 with P1"""
+    network = create_simple_network()
+    network.add_paths_batch([["e1", "e2"]])
+    return FlowController(network)
+
+
+def test_path_bottlenecks_matches_calculate_bottleneck():
+    controller = make_controller()
+    controller.network.edges["e4"].capacity = 3.0
+    network = controller.network
+
+    expected = [network.paths[pid].calculate_bottleneck(network.edges)[0] for pid in network.path_ids]
+    assert controller.path_bottlenecks().tolist() == expected == [8.0, 3.0, 8.0]
+
+
+def test_calculate_all_max_safe_flows_matches_per_path():
+    controller = make_controller()
+    controller.set_path_flow("P1", 2.0)
+    controller.set_path_flow("P2", 6.0)
+    controller.network.edges["e3"].capacity = 0.0
+
+    batch = controller.calculate_all_max_safe_flows()
+
+    assert list(batch) == controller.network.path_ids
+    for path_id, alternatives in batch.items():
+        assert alternatives == controller.calculate_max_safe_flow(path_id)
+    assert batch["P2"]["is_blocked"]
+
+
+def test_evaluate_flows_batch_matches_set_path_flow():
+    candidates = np.array([-1.0, 0.0, 2.0, 3.0, 8.0, 9.0])
+    controller = make_controller()
+    controller.set_path_flow("P1", 3.0)
+
+    ok_mask, available = controller.evaluate_flows_batch("P1", candidates)
+
+    for i, target in enumerate(candidates):
+        single = make_controller()
+        single.set_path_flow("P1", 3.0)
+        success, _ = single.set_path_flow("P1", float(target))
+        assert ok_mask[i] == success
+        assert available[i] == max(0.0, 8.0 - target)
+    assert controller.network.paths["P1"].current_flow == 3.0  # Nothing was applied
+
+    with pytest.raises(KeyError):
+        controller.evaluate_flows_batch("P9", candidates)
+
+
+def test_set_path_flows_matches_set_path_flow():
+    targets = [5.0, 7.0, 1.0]  # P2 exceeds its bottleneck of 6 and is rejected
+    batch = make_controller()
+    batch.set_path_flow("P2", 2.0)
+    single = make_controller()
+    single.set_path_flow("P2", 2.0)
+
+    ok_mask = batch.set_path_flows(targets)
+    expected = [single.set_path_flow(pid, t)[0] for pid, t in zip(single.network.path_ids, targets)]
+
+    assert ok_mask.tolist() == expected == [True, False, True]
+    assert batch.network.path_flows.tolist() == single.network.path_flows.tolist() == [5.0, 2.0, 1.0]
+    assert batch.network.edge_flows.tolist() == single.network.edge_flows.tolist() == [6.0, 6.0, 2.0, 2.0]
+
+
+def test_set_path_flows_clamps_edges_after_summing():
+    """Edge flows get every path's change first and are clamped at zero once"""
+    controller = make_controller()
+    controller.set_path_flow("P1", 3.0)
+    controller.network.edges["e1"].flow = 1.0  # Out of step with its paths (3.0)
+
+    controller.set_path_flows([0.0, 0.0, 2.0])
+
+    # 1 - 3 + 2 = 0; clamping after P1's change alone would give max(0, -2) + 2 = 2
+    assert controller.network.edges["e1"].flow == 0.0
+    assert controller.network.edges["e2"].flow == 2.0
+    assert controller.network.path_flows.tolist() == [0.0, 0.0, 2.0]
+
+
+def test_apply_adjustments_matches_update_path_flow():
+    adjustments = [("P1", 4.0), ("P2", 9.0), ("P3", 3.0), ("P1", -1.0), ("P9", 1.0)]
+    batch = make_controller()
+    single = make_controller()
+
+    results = batch.apply_adjustments(adjustments)
+
+    for (path_id, delta), (success, message, flows) in zip(adjustments, results):
+        assert (success, message) == single.update_path_flow(path_id, delta)
+        assert flows == single.network.path_flows.tolist()
+    assert [r[0] for r in results] == [True, False, True, True, False]
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Test the flow-control NetworkState path arrays"""
+
+import pytest
+
+from network_model import create_simple_network
+
+
+def test_add_paths_batch_appends_after_existing_paths():
+    """Batch-added paths are numbered after P1, P2 and keep existing flows"""
+    network = create_simple_network()
+    network.paths["P1"].current_flow = 4.0
+    network.paths["P2"].current_flow = 2.0
+    p1 = network.paths["P1"]
+
+    added = network.add_paths_batch([["e1", "e2"], ["e3", "e4"], ["e1", "e2"]])
+
+    assert added == ["P3", "P4", "P5"]
+    assert network.path_ids == list(network.paths) == ["P1", "P2", "P3", "P4", "P5"]
+    assert network.path_flows.tolist() == [4.0, 2.0, 0.0, 0.0, 0.0]
+    assert network.paths["P1"] is p1
+    assert [p.id for p in network._edge_paths["e1"]] == ["P1", "P3", "P5"]
+    assert [p.id for p in network._edge_paths["e4"]] == ["P2", "P4"]
+
+    network.paths["P4"].current_flow = 1.5
+    assert network.path_flows[3] == 1.5
+
+
+def test_add_paths_batch_rejects_taken_ids():
+    """A generated ID that is already in use raises and adds nothing"""
+    network = create_simple_network()
+    network.remove_path("P1")  # One path left, so the next generated ID is P2
+    with pytest.raises(ValueError):
+        network.add_paths_batch([["e1", "e2"]])
+    assert network.path_ids == ["P2"]
+    assert [p.id for p in network._edge_paths["e1"]] == []
+
+
+def test_remove_path_compacts_slots():
+    """Later paths move down one slot and keep their flows"""
+    network = create_simple_network()
+    network.add_paths_batch([["e1", "e2"]])
+    for flow, path_id in zip((1.0, 2.0, 3.0), ("P1", "P2", "P3")):
+        network.paths[path_id].current_flow = flow
+
+    removed = network.remove_path("P2")
+
+    assert network.path_ids == list(network.paths) == ["P1", "P3"]
+    assert network.path_flows.tolist() == [1.0, 3.0]
+    assert removed.current_flow == 2.0  # Detached with its last flow
+    assert [p.id for p in network._edge_paths["e3"]] == []
+    assert [p.id for p in network._edge_paths["e1"]] == ["P1", "P3"]
+
+    # The moved path writes to its new slot, and its bottleneck reads the right edges
+    network.paths["P3"].current_flow = 5.0
+    assert network.path_flows.tolist() == [1.0, 5.0]
+    assert network.paths["P3"].calculate_bottleneck(network.edges) == (8.0, "e2")
+
+
+def test_clear_paths():
+    """Clearing leaves no path state behind, and numbering starts over"""
+    network = create_simple_network()
+    network.paths["P1"].current_flow = 4.0
+    p1 = network.paths["P1"]
+
+    network.clear_paths()
+
+    assert network.paths == {}
+    assert network.path_ids == []
+    assert len(network.path_flows) == 0
+    assert network._edge_paths == {}
+    assert p1.current_flow == 4.0
+    assert network.add_paths_batch([["e3", "e4"]]) == ["P1"]
+    assert network.paths["P1"].current_flow == 0.0
+
+
+def test_is_solvable():
+    """Solvable while some s-t route has positive capacity on every edge"""
+    network = create_simple_network()
+    assert network.is_solvable()
+
+    network.edges["e2"].capacity = 0.0
+    assert network.is_solvable()  # s -> v2 -> t still open
+
+    network.edges["e3"].capacity = 0.0
+    assert not network.is_solvable()